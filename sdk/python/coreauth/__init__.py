@@ -1,6 +1,6 @@
 """CoreAuth Python SDK."""
 
-from .client import CoreAuthClient
+from .client import AsyncCoreAuthClient, CoreAuthClient
 from .exceptions import (
     ApiError,
     AuthenticationError,
@@ -14,6 +14,7 @@ from .exceptions import (
 
 __all__ = [
     "CoreAuthClient",
+    "AsyncCoreAuthClient",
     "CoreAuthError",
     "ApiError",
     "AuthenticationError",
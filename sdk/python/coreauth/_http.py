@@ -2,10 +2,19 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Callable, Hashable, Iterator, NamedTuple, Optional
 
 import httpx
+from httpx._utils import get_environment_proxies
 
+from . import _json
 from .exceptions import (
     ApiError,
     AuthenticationError,
@@ -17,31 +26,248 @@ from .exceptions import (
     ValidationError,
 )
 
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+DEFAULT_LIMITS = httpx.Limits(max_connections=1000, max_keepalive_connections=100, keepalive_expiry=60.0)
 
-class HttpClient:
-    """Low-level HTTP client wrapping httpx."""
+DEFAULT_CACHE_SIZE = 256
 
-    def __init__(self, base_url: str, token: Optional[str] = None) -> None:
+DEFAULT_MAX_RETRIES = 2
+# Longest Retry-After the transport will wait out itself; longer back-offs are
+# surfaced to the caller as RateLimitError/ApiError.
+MAX_RETRY_DELAY = 30.0
+
+_RETRY_STATUSES = frozenset((429, 503))
+_IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+try:
+    import ijson  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    ijson = None  # type: ignore[assignment]
+
+# HTTP/2 requires the optional ``h2`` package (``pip install coreauth[http2]``).
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Subclasses take (error, message); the status code is implied by the class.
+_ERROR_CLASSES: dict[int, Callable[[str, str], ApiError]] = {
+    400: ValidationError,
+    401: AuthenticationError,
+    403: ForbiddenError,
+    404: NotFoundError,
+    409: ConflictError,
+    429: RateLimitError,
+}
+
+
+class _CachedResponse(NamedTuple):
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content: bytes
+    expires: float
+
+
+def _max_age(cache_control: str) -> Optional[float]:
+    """Freshness lifetime from a Cache-Control header; None means "do not store"."""
+    max_age = 0.0
+    for directive in cache_control.lower().split(","):
+        name, _, value = directive.strip().partition("=")
+        if name == "no-store":
+            return None
+        if name == "no-cache":
+            return 0.0
+        if name == "max-age":
+            try:
+                max_age = max(float(value.strip('"')), 0.0)
+            except ValueError:
+                pass
+    return max_age
+
+
+def _select_items(body: Any, prefix: str) -> list[Any]:
+    """Elements addressed by an ijson-style ``prefix`` in an already decoded body."""
+    for part in prefix.split(".")[:-1]:
+        body = body.get(part) if isinstance(body, dict) else None
+    return body if isinstance(body, list) else []
+
+
+class _EventParser:
+    """Accumulates ``text/event-stream`` lines and returns each event's decoded ``data``."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self) -> None:
+        self._data: list[str] = []
+
+    def feed(self, line: str) -> tuple[bool, Any]:
+        """Consume one line; returns ``(True, payload)`` when it completes an event."""
+        if not line:
+            if not self._data:
+                return False, None
+            data = "\n".join(self._data)
+            self._data.clear()
+            try:
+                return True, _json.loads(data)
+            except ValueError as e:
+                raise CoreAuthError(f"Malformed server-sent event data {data[:200]!r}: {e}") from e
+        if line.startswith("data:"):
+            value = line[5:]
+            self._data.append(value[1:] if value.startswith(" ") else value)
+        # ``event:``, ``id:``, ``retry:`` and ``:`` comment lines carry nothing we use.
+        return False, None
+
+
+# Server-sent event streams stay open indefinitely between events.
+_STREAM_TIMEOUT = httpx.Timeout(None, connect=DEFAULT_TIMEOUT.connect)
+
+
+class _ItemParser:
+    """Incremental parser yielding array elements under ``prefix`` as bytes arrive.
+
+    Uses ``ijson`` when installed (``pip install coreauth[streaming]``); otherwise
+    the body is buffered and decoded once at the end.
+    """
+
+    __slots__ = ("_prefix", "_items", "_coro", "_buffer")
+
+    def __init__(self, prefix: str) -> None:
+        self._prefix = prefix
+        self._buffer = bytearray()
+        if ijson is not None:
+            self._items = ijson.sendable_list()
+            self._coro = ijson.items_coro(self._items, prefix, use_float=True)
+        else:
+            self._items = []
+            self._coro = None
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        if self._coro is None:
+            self._buffer += chunk
+            return []
+        self._coro.send(chunk)
+        items = list(self._items)
+        del self._items[:]
+        return items
+
+    def close(self) -> list[Any]:
+        if self._coro is None:
+            return _select_items(_json.loads(self._buffer), self._prefix) if self._buffer else []
+        self._coro.close()
+        return list(self._items)
+
+
+def _retry_delay(method: str, resp: httpx.Response, attempt: int) -> Optional[float]:
+    """Seconds to wait before retrying ``resp``, or None if it should not be retried.
+
+    Only 429/503 responses to idempotent requests are retried; ``Retry-After`` is
+    honoured when present and otherwise the delay backs off exponentially from
+    100 ms.
+    """
+    if resp.status_code not in _RETRY_STATUSES or method not in _IDEMPOTENT_METHODS:
+        return None
+    retry_after = resp.headers.get("retry-after")
+    if retry_after is None:
+        return 0.1 * 2**attempt
+    try:
+        delay = float(retry_after)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return 0.1 * 2**attempt
+    delay = max(delay, 0.0)
+    return delay if delay <= MAX_RETRY_DELAY else None
+
+
+class _BaseHttpClient:
+    """State and response handling shared by the sync and async transports.
+
+    Successful GET responses carrying an ``ETag``/``Last-Modified`` validator or a
+    ``Cache-Control: max-age`` are kept in a small LRU keyed by URL, params and
+    token. Fresh entries are served locally; stale ones are revalidated with
+    ``If-None-Match``/``If-Modified-Since`` and a ``304`` reuses the cached body.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
         self._base_url = base_url.rstrip("/")
         self._token: Optional[str] = token
-        self._client = httpx.Client(timeout=30.0)
+        self._max_retries = max_retries
+        self._cache_size = cache_size
+        self._cache: OrderedDict[Hashable, _CachedResponse] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._build_headers()
 
     def set_token(self, token: str) -> None:
         self._token = token
+        self._build_headers()
 
     def clear_token(self) -> None:
         self._token = None
+        self._build_headers()
 
-    def _headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {"Content-Type": "application/json"}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
-        return headers
+    def _build_headers(self) -> None:
+        # Built once per token change; httpx merges per-request headers without
+        # mutating the dicts passed in, so they can be shared by every request.
+        auth = {"Authorization": f"Bearer {self._token}"} if self._token else {}
+        self._auth_headers: dict[str, str] = auth
+        self._json_headers: dict[str, str] = {"Content-Type": "application/json", **auth}
+        self._form_headers: dict[str, str] = {"Content-Type": "application/x-www-form-urlencoded", **auth}
+
+    def _request_key(self, path: str, params: Optional[dict[str, Any]]) -> Optional[Hashable]:
+        """Identity of a GET for in-flight coalescing, or None if params are unhashable."""
+        try:
+            key = (path, frozenset(params.items()) if params else None, self._token)
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def _cache_lookup(self, key: Optional[Hashable]) -> Optional[_CachedResponse]:
+        if key is None or not self._cache_size:
+            return None
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                self._cache.move_to_end(key)
+        return entry
 
-    def _form_headers(self) -> dict[str, str]:
-        headers: dict[str, str] = {"Content-Type": "application/x-www-form-urlencoded"}
-        if self._token:
-            headers["Authorization"] = f"Bearer {self._token}"
+    def _cache_store(self, key: Optional[Hashable], resp: httpx.Response) -> None:
+        if key is None or not self._cache_size or resp.status_code != 200:
+            return
+        max_age = _max_age(resp.headers.get("cache-control", ""))
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        with self._cache_lock:
+            if max_age is None or not (etag or last_modified or max_age):
+                self._cache.pop(key, None)
+                return
+            self._cache[key] = _CachedResponse(etag, last_modified, resp.content, time.monotonic() + max_age)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _cache_revalidated(self, key: Hashable, entry: _CachedResponse, resp: httpx.Response) -> Any:
+        """Refresh ``entry`` after a 304 and return its decoded body."""
+        max_age = _max_age(resp.headers.get("cache-control", "")) or 0.0
+        with self._cache_lock:
+            self._cache[key] = entry._replace(expires=time.monotonic() + max_age)
+        return _json.loads(entry.content) if entry.content else None
+
+    @staticmethod
+    def _encode(json: Optional[dict[str, Any]]) -> Optional[bytes]:
+        return None if json is None else _json.dumps(json)
+
+    @staticmethod
+    def _conditional_headers(headers: dict[str, str], entry: _CachedResponse) -> dict[str, str]:
+        headers = dict(headers)
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
         return headers
 
     def _handle_response(self, resp: httpx.Response) -> Any:
@@ -50,76 +276,424 @@ class HttpClient:
         if 200 <= resp.status_code < 300:
             if not resp.content:
                 return None
-            return resp.json()
-        # Error handling
-        try:
-            body = resp.json()
-            error = body.get("error", "")
-            message = body.get("message", "")
-        except Exception:
-            error = ""
-            message = resp.text
-
-        error_map = {
-            400: ValidationError,
-            401: AuthenticationError,
-            403: ForbiddenError,
-            404: NotFoundError,
-            409: ConflictError,
-            429: RateLimitError,
-        }
-        cls = error_map.get(resp.status_code, ApiError)
-        if cls is ApiError:
+            return _json.loads(resp.content)
+        # Error handling. Only decode bodies that declare JSON; proxies and load
+        # balancers answer 502/503 with HTML, which would otherwise fail to parse.
+        error = ""
+        message = resp.text
+        if resp.content and "json" in resp.headers.get("content-type", ""):
+            try:
+                body = _json.loads(resp.content)
+            except ValueError:
+                body = None
+            if isinstance(body, dict):
+                error = body.get("error", "")
+                message = body.get("message", "")
+
+        cls = _ERROR_CLASSES.get(resp.status_code)
+        if cls is None:
             raise ApiError(resp.status_code, error, message)
         raise cls(error, message)
 
+
+class _SharedTransport(httpx.BaseTransport):
+    """Per-client view of a pooled transport; closing the client leaves the pool open."""
+
+    __slots__ = ("_transport",)
+
+    def __init__(self, transport: httpx.BaseTransport) -> None:
+        self._transport = transport
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class HttpClient(_BaseHttpClient):
+    """Low-level HTTP client wrapping httpx.
+
+    HTTP/2 is enabled by default when ``h2`` is installed so that bursts of calls
+    against one CoreAuth host share a single multiplexed connection.
+
+    Instances created for the same base URL and transport settings share one
+    process-wide connection pool (``httpx.HTTPTransport``), so keep-alive
+    connections survive across separately constructed SDK clients. Each
+    instance still has its own ``httpx.Client`` and therefore its own cookie
+    jar: session cookies set for one user or tenant never ride along on
+    another instance's requests. Proxies from ``HTTP_PROXY``/``HTTPS_PROXY``/
+    ``ALL_PROXY`` (honouring ``NO_PROXY``) get pooled transports of their own,
+    mounted the way httpx would mount them. The shared transports are
+    reference counted and closed when the last instance using them is closed.
+    """
+
+    # (base_url, http2, limits..., env proxies)
+    #   -> [httpx.HTTPTransport, {URL pattern: proxy transport or None}, reference count]
+    _POOL: dict[tuple[Any, ...], list[Any]] = {}
+    _POOL_LOCK = threading.Lock()
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        *,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        super().__init__(base_url, token, cache_size, max_retries)
+        http2 = HTTP2_AVAILABLE if http2 is None else http2
+        limits = limits or DEFAULT_LIMITS
+        proxies = tuple(sorted(get_environment_proxies().items()))
+        self._pool_key = (
+            self._base_url,
+            http2,
+            limits.max_connections,
+            limits.max_keepalive_connections,
+            limits.keepalive_expiry,
+            proxies,
+        )
+        with self._POOL_LOCK:
+            entry = self._POOL.get(self._pool_key)
+            if entry is None:
+                transport = httpx.HTTPTransport(http2=http2, limits=limits)
+                mounts = {
+                    pattern: None if url is None else httpx.HTTPTransport(http2=http2, limits=limits, proxy=url)
+                    for pattern, url in proxies
+                }
+                entry = self._POOL[self._pool_key] = [transport, mounts, 0]
+            entry[2] += 1
+        self._transport: httpx.HTTPTransport = entry[0]
+        self._mounts: dict[str, Optional[httpx.HTTPTransport]] = entry[1]
+        # Passing transport= stops httpx from mounting the environment proxies
+        # itself, so the pooled proxy transports are mounted explicitly.
+        self._client = httpx.Client(
+            transport=_SharedTransport(self._transport),
+            mounts={pattern: None if t is None else _SharedTransport(t) for pattern, t in self._mounts.items()},
+            timeout=DEFAULT_TIMEOUT,
+        )
+        self._closed = False
+        self._inflight: dict[Hashable, Future] = {}
+        self._inflight_lock = threading.Lock()
+
     def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
-        url = f"{self._base_url}{path}"
+        """GET ``path``; concurrent identical GETs from other threads share one request.
+
+        Coalesced callers receive the same decoded object and should not mutate it.
+        """
+        key = self._request_key(path, params)
+        if key is None:
+            return self._get(path, params, key)
+        with self._inflight_lock:
+            existing = self._inflight.get(key)
+            if existing is None:
+                fut: Future = Future()
+                self._inflight[key] = fut
+        if existing is not None:
+            return existing.result()
         try:
-            resp = self._client.get(url, headers=self._headers(), params=params)
-        except httpx.HTTPError as e:
-            raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
+            result = self._get(path, params, key)
+        except BaseException as e:
+            self._finish_inflight(key)
+            fut.set_exception(e)
+            raise
+        self._finish_inflight(key)
+        fut.set_result(result)
+        return result
 
-    def post(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+    def _finish_inflight(self, key: Hashable) -> None:
+        with self._inflight_lock:
+            del self._inflight[key]
+
+    def _get(self, path: str, params: Optional[dict[str, Any]], key: Optional[Hashable]) -> Any:
+        headers = self._json_headers
+        entry = self._cache_lookup(key)
+        if entry is not None:
+            if entry.expires > time.monotonic():
+                return _json.loads(entry.content) if entry.content else None
+            headers = self._conditional_headers(headers, entry)
+        resp = self._send("GET", path, headers=headers, params=params)
+        if resp.status_code == 304 and entry is not None:
+            return self._cache_revalidated(key, entry, resp)
+        result = self._handle_response(resp)
+        self._cache_store(key, resp)
+        return result
+
+    def stream_items(self, path: str, prefix: str = "item", params: Optional[dict[str, Any]] = None) -> Iterator[Any]:
+        """GET ``path`` and yield the array elements under ``prefix`` as they are parsed.
+
+        The response is read chunk by chunk, so memory stays bounded by the largest
+        record rather than the whole body. ``prefix`` follows ijson syntax, e.g.
+        ``"item"`` for a top-level array or ``"executions.item"`` for a nested one.
+        """
         url = f"{self._base_url}{path}"
         try:
-            resp = self._client.post(url, headers=self._headers(), json=json)
+            with self._client.stream("GET", url, headers=self._json_headers, params=params) as resp:
+                if not 200 <= resp.status_code < 300:
+                    resp.read()
+                    self._handle_response(resp)
+                parser = _ItemParser(prefix)
+                for chunk in resp.iter_bytes():
+                    yield from parser.feed(chunk)
+                yield from parser.close()
         except httpx.HTTPError as e:
             raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
 
-    def post_form(self, path: str, data: dict[str, Any]) -> Any:
+    def stream_events(self, path: str, params: Optional[dict[str, Any]] = None) -> Iterator[Any]:
+        """Open a server-sent event stream at ``path`` and yield each event's JSON ``data``."""
         url = f"{self._base_url}{path}"
+        headers = {**self._auth_headers, "Accept": "text/event-stream"}
         try:
-            resp = self._client.post(url, headers=self._form_headers(), data=data)
+            with self._client.stream("GET", url, headers=headers, params=params, timeout=_STREAM_TIMEOUT) as resp:
+                if not 200 <= resp.status_code < 300:
+                    resp.read()
+                    self._handle_response(resp)
+                parser = _EventParser()
+                for line in resp.iter_lines():
+                    done, payload = parser.feed(line)
+                    if done:
+                        yield payload
         except httpx.HTTPError as e:
             raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
 
-    def put(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Issue a request and return the raw response, wrapping transport errors.
+
+        Rate-limited (429) and unavailable (503) responses to idempotent requests
+        are retried up to ``max_retries`` times, honouring ``Retry-After``.
+        """
         url = f"{self._base_url}{path}"
-        try:
-            resp = self._client.put(url, headers=self._headers(), json=json)
-        except httpx.HTTPError as e:
-            raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
+        if headers is None:
+            headers = self._json_headers
+        attempt = 0
+        while True:
+            try:
+                resp = self._client.request(method, url, headers=headers, content=content, data=data, params=params)
+            except httpx.HTTPError as e:
+                raise CoreAuthError(f"Request failed: {e}") from e
+            if attempt >= self._max_retries:
+                return resp
+            delay = _retry_delay(method, resp, attempt)
+            if delay is None:
+                return resp
+            attempt += 1
+            time.sleep(delay)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        return self._handle_response(self._send(method, path, headers=headers, content=content, data=data))
+
+    def post(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return self._request("POST", path, content=self._encode(json))
+
+    def post_empty(self, path: str) -> Any:
+        """POST without a body or ``Content-Type``, for action endpoints that take no input."""
+        return self._request("POST", path, headers=self._auth_headers)
+
+    def post_form(self, path: str, data: dict[str, Any]) -> Any:
+        return self._request("POST", path, headers=self._form_headers, data=data)
+
+    def put(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return self._request("PUT", path, content=self._encode(json))
 
     def patch(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return self._request("PATCH", path, content=self._encode(json))
+
+    def delete(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return self._request("DELETE", path, content=self._encode(json))
+
+    def close(self) -> None:
+        """Close this instance's client and release its share of the pooled transport."""
+        with self._POOL_LOCK:
+            if self._closed:
+                return
+            self._closed = True
+            self._client.close()
+            entry = self._POOL.get(self._pool_key)
+            if entry is None or entry[0] is not self._transport:
+                return
+            entry[2] -= 1
+            if entry[2] > 0:
+                return
+            del self._POOL[self._pool_key]
+        self._transport.close()
+        for transport in self._mounts.values():
+            if transport is not None:
+                transport.close()
+
+
+class AsyncHttpClient(_BaseHttpClient):
+    """Asyncio counterpart of :class:`HttpClient` wrapping ``httpx.AsyncClient``.
+
+    One ``AsyncClient`` (and its connection pool) is reused for every request made
+    through this instance, so concurrent calls issued with ``asyncio.gather``
+    share keep-alive / HTTP/2 connections.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        *,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        super().__init__(base_url, token, cache_size, max_retries)
+        self._client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE if http2 is None else http2,
+            timeout=DEFAULT_TIMEOUT,
+            limits=limits or DEFAULT_LIMITS,
+        )
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    async def get(self, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+        """GET ``path``; concurrent identical GETs share one request.
+
+        Coalesced callers receive the same decoded object and should not mutate it.
+        Cancelling one caller does not cancel the shared request for the others.
+        """
+        key = self._request_key(path, params)
+        if key is None:
+            return await self._get(path, params, key)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._get(path, params, key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _get(self, path: str, params: Optional[dict[str, Any]], key: Optional[Hashable]) -> Any:
+        headers = self._json_headers
+        entry = self._cache_lookup(key)
+        if entry is not None:
+            if entry.expires > time.monotonic():
+                return _json.loads(entry.content) if entry.content else None
+            headers = self._conditional_headers(headers, entry)
+        resp = await self._send("GET", path, headers=headers, params=params)
+        if resp.status_code == 304 and entry is not None:
+            return self._cache_revalidated(key, entry, resp)
+        result = self._handle_response(resp)
+        self._cache_store(key, resp)
+        return result
+
+    async def stream_items(
+        self, path: str, prefix: str = "item", params: Optional[dict[str, Any]] = None
+    ) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`HttpClient.stream_items`."""
         url = f"{self._base_url}{path}"
         try:
-            resp = self._client.patch(url, headers=self._headers(), json=json)
+            async with self._client.stream("GET", url, headers=self._json_headers, params=params) as resp:
+                if not 200 <= resp.status_code < 300:
+                    await resp.aread()
+                    self._handle_response(resp)
+                parser = _ItemParser(prefix)
+                async for chunk in resp.aiter_bytes():
+                    for item in parser.feed(chunk):
+                        yield item
+                for item in parser.close():
+                    yield item
         except httpx.HTTPError as e:
             raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
 
-    def delete(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+    async def stream_events(self, path: str, params: Optional[dict[str, Any]] = None) -> AsyncIterator[Any]:
+        """Async counterpart of :meth:`HttpClient.stream_events`."""
         url = f"{self._base_url}{path}"
+        headers = {**self._auth_headers, "Accept": "text/event-stream"}
         try:
-            resp = self._client.delete(url, headers=self._headers(), json=json)
+            stream = self._client.stream("GET", url, headers=headers, params=params, timeout=_STREAM_TIMEOUT)
+            async with stream as resp:
+                if not 200 <= resp.status_code < 300:
+                    await resp.aread()
+                    self._handle_response(resp)
+                parser = _EventParser()
+                async for line in resp.aiter_lines():
+                    done, payload = parser.feed(line)
+                    if done:
+                        yield payload
         except httpx.HTTPError as e:
             raise CoreAuthError(f"Request failed: {e}") from e
-        return self._handle_response(resp)
 
-    def close(self) -> None:
-        self._client.close()
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        data: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Issue a request and return the raw response, wrapping transport errors.
+
+        Rate-limited (429) and unavailable (503) responses to idempotent requests
+        are retried up to ``max_retries`` times, honouring ``Retry-After``.
+        """
+        url = f"{self._base_url}{path}"
+        if headers is None:
+            headers = self._json_headers
+        attempt = 0
+        while True:
+            try:
+                resp = await self._client.request(method, url, headers=headers, content=content, data=data, params=params)
+            except httpx.HTTPError as e:
+                raise CoreAuthError(f"Request failed: {e}") from e
+            if attempt >= self._max_retries:
+                return resp
+            delay = _retry_delay(method, resp, attempt)
+            if delay is None:
+                return resp
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        *,
+        headers: Optional[dict[str, str]] = None,
+        content: Optional[bytes] = None,
+        data: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        return self._handle_response(await self._send(method, path, headers=headers, content=content, data=data))
+
+    async def post(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return await self._request("POST", path, content=self._encode(json))
+
+    async def post_empty(self, path: str) -> Any:
+        """POST without a body or ``Content-Type``, for action endpoints that take no input."""
+        return await self._request("POST", path, headers=self._auth_headers)
+
+    async def post_form(self, path: str, data: dict[str, Any]) -> Any:
+        return await self._request("POST", path, headers=self._form_headers, data=data)
+
+    async def put(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return await self._request("PUT", path, content=self._encode(json))
+
+    async def patch(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return await self._request("PATCH", path, content=self._encode(json))
+
+    async def delete(self, path: str, json: Optional[dict[str, Any]] = None) -> Any:
+        return await self._request("DELETE", path, content=self._encode(json))
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
@@ -0,0 +1,27 @@
+"""JSON codec used by the SDK transport.
+
+Uses ``orjson`` when installed (``pip install coreauth[speedups]``) and falls back
+to the standard library otherwise. ``dumps`` always returns compact UTF-8 bytes.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+if orjson is not None:
+    loads = orjson.loads
+
+    def dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+else:
+    loads = json.loads
+
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), allow_nan=False).encode("utf-8")
@@ -0,0 +1,7 @@
+"""SCIM protocol constants shared by the service layer and the request models."""
+
+# Schema URNs the server requires on SCIM request bodies (RFC 7643/7644). Shared
+# tuples, so building a request body does not allocate a new list each time.
+USER_SCHEMAS = ("urn:ietf:params:scim:schemas:core:2.0:User",)
+GROUP_SCHEMAS = ("urn:ietf:params:scim:schemas:core:2.0:Group",)
+PATCH_OP_SCHEMAS = ("urn:ietf:params:scim:api:messages:2.0:PatchOp",)
@@ -2,23 +2,73 @@
 
 from __future__ import annotations
 
-from typing import Optional
-
-from ._http import HttpClient
-from .services import (
-    AdminService,
-    ApplicationsService,
-    AuditService,
-    AuthService,
-    ConnectionsService,
-    FgaService,
-    GroupsService,
-    MfaService,
-    OAuth2Service,
-    ScimService,
-    TenantsService,
-    WebhooksService,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Optional
+
+import httpx
+
+from ._batch import DEFAULT_BATCH_WORKERS, AsyncBatch, Batch
+from ._http import DEFAULT_CACHE_SIZE, DEFAULT_MAX_RETRIES, AsyncHttpClient, HttpClient
+
+if TYPE_CHECKING:
+    from .services import (
+        AdminService,
+        ApplicationsService,
+        AsyncAdminService,
+        AsyncApplicationsService,
+        AsyncAuditService,
+        AsyncAuthService,
+        AsyncConnectionsService,
+        AsyncFgaService,
+        AsyncGroupsService,
+        AsyncMfaService,
+        AsyncOAuth2Service,
+        AsyncScimService,
+        AsyncTenantsService,
+        AsyncWebhooksService,
+        AuditService,
+        AuthService,
+        ConnectionsService,
+        FgaService,
+        GroupsService,
+        MfaService,
+        OAuth2Service,
+        ScimService,
+        TenantsService,
+        WebhooksService,
+    )
+
+# Attribute name -> (module under coreauth.services, class name). Services are
+# imported and instantiated on first access, so a script that only touches
+# ``client.auth`` never loads the other modules.
+_SERVICE_MAP = {
+    "auth": ("auth", "AuthService"),
+    "oauth2": ("oauth2", "OAuth2Service"),
+    "mfa": ("mfa", "MfaService"),
+    "tenants": ("tenants", "TenantsService"),
+    "applications": ("applications", "ApplicationsService"),
+    "fga": ("fga", "FgaService"),
+    "audit": ("audit", "AuditService"),
+    "webhooks": ("webhooks", "WebhooksService"),
+    "groups": ("groups", "GroupsService"),
+    "scim": ("scim", "ScimService"),
+    "admin": ("admin", "AdminService"),
+    "connections": ("connections", "ConnectionsService"),
+}
+
+_ASYNC_SERVICE_MAP = {name: (module, f"Async{cls}") for name, (module, cls) in _SERVICE_MAP.items()}
+
+
+def _load_service(client: Any, service_map: dict[str, tuple[str, str]], name: str) -> Any:
+    """Instantiate the service registered under ``name`` and cache it on ``client``."""
+    try:
+        module_name, class_name = service_map[name]
+    except KeyError:
+        raise AttributeError(f"{type(client).__name__!r} object has no attribute {name!r}") from None
+    module = importlib.import_module(f".services.{module_name}", __package__)
+    service = getattr(module, class_name)(client._http)
+    setattr(client, name, service)
+    return service
 
 
 class CoreAuthClient:
@@ -29,22 +79,43 @@ class CoreAuthClient:
         resp = client.auth.login("my-tenant", "user@example.com", "password")
         client.set_token(resp["access_token"])
         profile = client.auth.get_profile()
+
+    ``http2`` and ``limits`` tune the underlying connection pool; HTTP/2 is used
+    by default when the ``h2`` package is installed. ``cache_size`` bounds the
+    number of GET responses kept for ETag revalidation (``0`` disables it).
+    ``max_retries`` bounds automatic retries of idempotent requests answered with
+    429/503 (``0`` disables them).
     """
 
-    def __init__(self, base_url: str, token: Optional[str] = None) -> None:
-        self._http = HttpClient(base_url, token)
-        self.auth = AuthService(self._http)
-        self.oauth2 = OAuth2Service(self._http)
-        self.mfa = MfaService(self._http)
-        self.tenants = TenantsService(self._http)
-        self.applications = ApplicationsService(self._http)
-        self.fga = FgaService(self._http)
-        self.audit = AuditService(self._http)
-        self.webhooks = WebhooksService(self._http)
-        self.groups = GroupsService(self._http)
-        self.scim = ScimService(self._http)
-        self.admin = AdminService(self._http)
-        self.connections = ConnectionsService(self._http)
+    auth: AuthService
+    oauth2: OAuth2Service
+    mfa: MfaService
+    tenants: TenantsService
+    applications: ApplicationsService
+    fga: FgaService
+    audit: AuditService
+    webhooks: WebhooksService
+    groups: GroupsService
+    scim: ScimService
+    admin: AdminService
+    connections: ConnectionsService
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        *,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        self._http = HttpClient(
+            base_url, token, http2=http2, limits=limits, cache_size=cache_size, max_retries=max_retries
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return _load_service(self, _SERVICE_MAP, name)
 
     def set_token(self, token: str) -> None:
         """Set the bearer token for all subsequent requests."""
@@ -54,6 +125,13 @@ class CoreAuthClient:
         """Remove the bearer token."""
         self._http.clear_token()
 
+    def batch(self, max_workers: int = DEFAULT_BATCH_WORKERS) -> Batch:
+        """Queue service calls inside a ``with`` block and send them together on exit.
+
+        See :class:`coreauth._batch.Batch`.
+        """
+        return Batch(self, max_workers)
+
     def close(self) -> None:
         """Close the underlying HTTP client."""
         self._http.close()
@@ -66,3 +144,71 @@ class CoreAuthClient:
 
     def __repr__(self) -> str:
         return f"CoreAuthClient(base_url={self._http._base_url!r})"
+
+
+class AsyncCoreAuthClient:
+    """Asyncio client for the CoreAuth API.
+
+    All service methods are coroutines, so independent calls can be overlapped:
+
+        async with AsyncCoreAuthClient("http://localhost:3000", token=token) as client:
+            logs, stats = await asyncio.gather(
+                client.audit.query(limit=100),
+                client.audit.stats(),
+            )
+    """
+
+    auth: AsyncAuthService
+    oauth2: AsyncOAuth2Service
+    mfa: AsyncMfaService
+    tenants: AsyncTenantsService
+    applications: AsyncApplicationsService
+    fga: AsyncFgaService
+    audit: AsyncAuditService
+    webhooks: AsyncWebhooksService
+    groups: AsyncGroupsService
+    scim: AsyncScimService
+    admin: AsyncAdminService
+    connections: AsyncConnectionsService
+
+    def __init__(
+        self,
+        base_url: str,
+        token: Optional[str] = None,
+        *,
+        http2: Optional[bool] = None,
+        limits: Optional[httpx.Limits] = None,
+        cache_size: int = DEFAULT_CACHE_SIZE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+    ) -> None:
+        self._http = AsyncHttpClient(
+            base_url, token, http2=http2, limits=limits, cache_size=cache_size, max_retries=max_retries
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        return _load_service(self, _ASYNC_SERVICE_MAP, name)
+
+    def set_token(self, token: str) -> None:
+        """Set the bearer token for all subsequent requests."""
+        self._http.set_token(token)
+
+    def clear_token(self) -> None:
+        """Remove the bearer token."""
+        self._http.clear_token()
+
+    def batch(self) -> AsyncBatch:
+        """Queue service calls inside an ``async with`` block and send them concurrently on exit."""
+        return AsyncBatch(self)
+
+    async def aclose(self) -> None:
+        """Close the underlying HTTP client."""
+        await self._http.aclose()
+
+    async def __aenter__(self) -> AsyncCoreAuthClient:
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.aclose()
+
+    def __repr__(self) -> str:
+        return f"AsyncCoreAuthClient(base_url={self._http._base_url!r})"
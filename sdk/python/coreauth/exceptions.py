@@ -6,20 +6,43 @@ from __future__ import annotations
 class CoreAuthError(Exception):
     """Base exception for all CoreAuth SDK errors."""
 
+    __slots__ = ()
+
 
 class ApiError(CoreAuthError):
     """API returned a non-2xx response."""
 
+    __slots__ = ("status_code", "error", "message")
+
     def __init__(self, status_code: int, error: str = "", message: str = "") -> None:
         self.status_code = status_code
         self.error = error
         self.message = message
-        super().__init__(f"[{status_code}] {error}: {message}" if error else f"[{status_code}] {message}")
+        # The display string is built in __str__, so exceptions that are caught and
+        # retried (e.g. on 429) never pay for formatting it.
+        super().__init__(status_code, error, message)
+
+    def __str__(self) -> str:
+        if self.error:
+            return f"[{self.status_code}] {self.error}: {self.message}"
+        return f"[{self.status_code}] {self.message}"
+
+    def __reduce__(self) -> tuple:
+        # Slotted attributes are not part of the default exception pickle state.
+        return (_restore_api_error, (type(self), self.status_code, self.error, self.message))
+
+
+def _restore_api_error(cls: type[ApiError], status_code: int, error: str, message: str) -> ApiError:
+    err = cls.__new__(cls)
+    ApiError.__init__(err, status_code, error, message)
+    return err
 
 
 class AuthenticationError(ApiError):
     """401 Unauthorized."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "unauthorized", message: str = "Authentication required") -> None:
         super().__init__(401, error, message)
 
@@ -27,6 +50,8 @@ class AuthenticationError(ApiError):
 class ForbiddenError(ApiError):
     """403 Forbidden."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "forbidden", message: str = "Insufficient permissions") -> None:
         super().__init__(403, error, message)
 
@@ -34,6 +59,8 @@ class ForbiddenError(ApiError):
 class NotFoundError(ApiError):
     """404 Not Found."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "not_found", message: str = "Resource not found") -> None:
         super().__init__(404, error, message)
 
@@ -41,6 +68,8 @@ class NotFoundError(ApiError):
 class ConflictError(ApiError):
     """409 Conflict."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "conflict", message: str = "Resource already exists") -> None:
         super().__init__(409, error, message)
 
@@ -48,6 +77,8 @@ class ConflictError(ApiError):
 class ValidationError(ApiError):
     """400 Bad Request."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "validation_error", message: str = "Invalid request") -> None:
         super().__init__(400, error, message)
 
@@ -55,5 +86,7 @@ class ValidationError(ApiError):
 class RateLimitError(ApiError):
     """429 Too Many Requests."""
 
+    __slots__ = ()
+
     def __init__(self, error: str = "rate_limited", message: str = "Rate limit exceeded") -> None:
         super().__init__(429, error, message)
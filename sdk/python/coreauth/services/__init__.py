@@ -1,12 +1,63 @@
-from .auth import AuthService
-from .oauth2 import OAuth2Service
-from .mfa import MfaService
-from .tenants import TenantsService
-from .applications import ApplicationsService
-from .fga import FgaService
-from .audit import AuditService
-from .webhooks import WebhooksService
-from .groups import GroupsService
-from .scim import ScimService
-from .admin import AdminService
-from .connections import ConnectionsService
+"""Service classes, imported lazily on first attribute access."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .admin import AdminService, AsyncAdminService
+    from .applications import ApplicationsService, AsyncApplicationsService
+    from .audit import AsyncAuditService, AuditService
+    from .auth import AsyncAuthService, AuthService
+    from .connections import AsyncConnectionsService, ConnectionsService
+    from .fga import AsyncFgaService, FgaService
+    from .groups import AsyncGroupsService, GroupsService
+    from .mfa import AsyncMfaService, MfaService
+    from .oauth2 import AsyncOAuth2Service, OAuth2Service
+    from .scim import AsyncScimService, ScimService
+    from .tenants import AsyncTenantsService, TenantsService
+    from .webhooks import AsyncWebhooksService, WebhooksService
+
+_MODULES = {
+    "AuthService": "auth",
+    "AsyncAuthService": "auth",
+    "OAuth2Service": "oauth2",
+    "AsyncOAuth2Service": "oauth2",
+    "MfaService": "mfa",
+    "AsyncMfaService": "mfa",
+    "TenantsService": "tenants",
+    "AsyncTenantsService": "tenants",
+    "ApplicationsService": "applications",
+    "AsyncApplicationsService": "applications",
+    "FgaService": "fga",
+    "AsyncFgaService": "fga",
+    "AuditService": "audit",
+    "AsyncAuditService": "audit",
+    "WebhooksService": "webhooks",
+    "AsyncWebhooksService": "webhooks",
+    "GroupsService": "groups",
+    "AsyncGroupsService": "groups",
+    "ScimService": "scim",
+    "AsyncScimService": "scim",
+    "AdminService": "admin",
+    "AsyncAdminService": "admin",
+    "ConnectionsService": "connections",
+    "AsyncConnectionsService": "connections",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
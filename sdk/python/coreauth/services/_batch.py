@@ -0,0 +1,19 @@
+"""Helpers for batch endpoints that may not exist on older servers."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from ..exceptions import NotFoundError
+
+
+def route_missing(error: NotFoundError) -> bool:
+    """True for a 404 from the router itself (no JSON error body), not from a handler."""
+    return not error.error
+
+
+def fan_out(fn: Callable[[Any], Any], items: list[Any], max_workers: int) -> list[Any]:
+    """Apply ``fn`` to ``items`` on a small thread pool, preserving order."""
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+        return list(pool.map(fn, items))
@@ -0,0 +1,43 @@
+"""Page iterators that fetch the next page while the current one is consumed."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Optional
+
+# A fetched page: its items and the cursor of the next page (None when done).
+Page = tuple[list[Any], Optional[Any]]
+
+
+def iter_pages(fetch: Callable[[Any], Page], start: Any) -> Iterator[Any]:
+    """Yield items page by page, requesting page N+1 in the background while N is consumed."""
+    pool = ThreadPoolExecutor(max_workers=1)
+    try:
+        items, cursor = fetch(start)
+        while True:
+            pending = pool.submit(fetch, cursor) if cursor is not None else None
+            yield from items
+            if pending is None:
+                return
+            items, cursor = pending.result()
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(fetch: Callable[[Any], Awaitable[Page]], start: Any) -> AsyncIterator[Any]:
+    """Async counterpart of :func:`iter_pages`."""
+    items, cursor = await fetch(start)
+    while True:
+        pending = asyncio.ensure_future(fetch(cursor)) if cursor is not None else None
+        try:
+            for item in items:
+                yield item
+        except BaseException:
+            # Consumer stopped early (aclose/cancel): don't leave the prefetch running.
+            if pending is not None:
+                pending.cancel()
+            raise
+        if pending is None:
+            return
+        items, cursor = await pending
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class AdminService:
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
@@ -33,13 +35,13 @@ class AdminService:
         })
 
     def activate(self, tenant_id: str) -> dict:
-        return self._http.post(f"/api/admin/tenants/{tenant_id}/activate")
+        return self._http.post_empty(f"/api/admin/tenants/{tenant_id}/activate")
 
     def suspend(self, tenant_id: str) -> dict:
-        return self._http.post(f"/api/admin/tenants/{tenant_id}/suspend")
+        return self._http.post_empty(f"/api/admin/tenants/{tenant_id}/suspend")
 
     def test_connection(self, tenant_id: str) -> dict:
-        return self._http.post(f"/api/admin/tenants/{tenant_id}/test-connection")
+        return self._http.post_empty(f"/api/admin/tenants/{tenant_id}/test-connection")
 
     # --- Actions ---
 
@@ -73,6 +75,15 @@ class AdminService:
     def get_org_executions(self, org_id: str) -> dict:
         return self._http.get(f"/api/organizations/{org_id}/actions/executions")
 
+    def iter_org_executions(
+        self, org_id: str, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> Iterator[dict]:
+        """Stream an organization's action executions, yielding them as they arrive."""
+        params = {k: v for k, v in (("limit", limit), ("offset", offset)) if v is not None}
+        return self._http.stream_items(
+            f"/api/organizations/{org_id}/actions/executions", "executions.item", params=params or None
+        )
+
     # --- Rate limits & token claims ---
 
     def get_rate_limits(self, tenant_id: str) -> dict:
@@ -91,3 +102,103 @@ class AdminService:
 
     def health(self) -> dict:
         return self._http.get("/health")
+
+
+class AsyncAdminService:
+    """Async variant of :class:`AdminService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    # --- Tenant Registry ---
+
+    async def list_tenants(self) -> dict:
+        return await self._http.get("/api/admin/tenants")
+
+    async def create_tenant(self, slug: str, name: str, isolation_mode: Optional[str] = None) -> dict:
+        body: dict[str, Any] = {"slug": slug, "name": name}
+        if isolation_mode:
+            body["isolation_mode"] = isolation_mode
+        return await self._http.post("/api/admin/tenants", json=body)
+
+    async def get_stats(self) -> dict:
+        return await self._http.get("/api/admin/tenants/stats")
+
+    async def get_tenant(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/admin/tenants/{tenant_id}")
+
+    async def configure_database(self, tenant_id: str, connection_string: str) -> dict:
+        return await self._http.post(f"/api/admin/tenants/{tenant_id}/database", json={
+            "connection_string": connection_string,
+        })
+
+    async def activate(self, tenant_id: str) -> dict:
+        return await self._http.post_empty(f"/api/admin/tenants/{tenant_id}/activate")
+
+    async def suspend(self, tenant_id: str) -> dict:
+        return await self._http.post_empty(f"/api/admin/tenants/{tenant_id}/suspend")
+
+    async def test_connection(self, tenant_id: str) -> dict:
+        return await self._http.post_empty(f"/api/admin/tenants/{tenant_id}/test-connection")
+
+    # --- Actions ---
+
+    async def create_action(self, org_id: str, name: str, trigger_type: str, code: str, **kwargs: Any) -> dict:
+        body: dict[str, Any] = {
+            "name": name,
+            "trigger_type": trigger_type,
+            "code": code,
+            **kwargs,
+        }
+        return await self._http.post(f"/api/organizations/{org_id}/actions", json=body)
+
+    async def list_actions(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/actions")
+
+    async def get_action(self, org_id: str, action_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/actions/{action_id}")
+
+    async def update_action(self, org_id: str, action_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/actions/{action_id}", json=kwargs)
+
+    async def delete_action(self, org_id: str, action_id: str) -> dict:
+        return await self._http.delete(f"/api/organizations/{org_id}/actions/{action_id}")
+
+    async def test_action(self, org_id: str, action_id: str, **kwargs: Any) -> dict:
+        return await self._http.post(f"/api/organizations/{org_id}/actions/{action_id}/test", json=kwargs)
+
+    async def get_action_executions(self, org_id: str, action_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/actions/{action_id}/executions")
+
+    async def get_org_executions(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/actions/executions")
+
+    def iter_org_executions(
+        self, org_id: str, limit: Optional[int] = None, offset: Optional[int] = None
+    ) -> AsyncIterator[dict]:
+        """Stream an organization's action executions, yielding them as they arrive."""
+        params = {k: v for k, v in (("limit", limit), ("offset", offset)) if v is not None}
+        return self._http.stream_items(
+            f"/api/organizations/{org_id}/actions/executions", "executions.item", params=params or None
+        )
+
+    # --- Rate limits & token claims ---
+
+    async def get_rate_limits(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/rate-limits")
+
+    async def update_rate_limits(self, tenant_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/tenants/{tenant_id}/rate-limits", json=kwargs)
+
+    async def get_token_claims(self, tenant_id: str, app_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/applications/{app_id}/token-claims")
+
+    async def update_token_claims(self, tenant_id: str, app_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/tenants/{tenant_id}/applications/{app_id}/token-claims", json=kwargs)
+
+    # --- Health ---
+
+    async def health(self) -> dict:
+        return await self._http.get("/health")
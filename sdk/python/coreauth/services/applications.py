@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import builtins
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class ApplicationsService:
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
@@ -17,8 +20,8 @@ class ApplicationsService:
         tenant_id: str,
         name: str,
         application_type: str,
-        redirect_uris: list[str],
-        allowed_scopes: list[str],
+        redirect_uris: builtins.list[str],
+        allowed_scopes: builtins.list[str],
         **kwargs: Any,
     ) -> dict:
         body: dict[str, Any] = {
@@ -41,7 +44,7 @@ class ApplicationsService:
         return self._http.post(f"/api/applications/{app_id}/tenants/{tenant_id}", json=kwargs)
 
     def rotate_secret(self, app_id: str, tenant_id: str) -> dict:
-        return self._http.post(f"/api/applications/{app_id}/tenants/{tenant_id}/rotate-secret")
+        return self._http.post_empty(f"/api/applications/{app_id}/tenants/{tenant_id}/rotate-secret")
 
     def delete(self, app_id: str, tenant_id: str) -> dict:
         return self._http.delete(f"/api/applications/{app_id}/tenants/{tenant_id}")
@@ -54,7 +57,7 @@ class ApplicationsService:
 
     # --- OAuth apps (org-scoped) ---
 
-    def create_oauth_app(self, org_id: str, name: str, slug: str, app_type: str, callback_urls: list[str], **kwargs: Any) -> dict:
+    def create_oauth_app(self, org_id: str, name: str, slug: str, app_type: str, callback_urls: builtins.list[str], **kwargs: Any) -> dict:
         body: dict[str, Any] = {
             "name": name,
             "slug": slug,
@@ -74,7 +77,7 @@ class ApplicationsService:
         return self._http.put(f"/api/organizations/{org_id}/applications/{app_id}", json=kwargs)
 
     def rotate_oauth_secret(self, org_id: str, app_id: str) -> dict:
-        return self._http.post(f"/api/organizations/{org_id}/applications/{app_id}/rotate-secret")
+        return self._http.post_empty(f"/api/organizations/{org_id}/applications/{app_id}/rotate-secret")
 
     def delete_oauth_app(self, org_id: str, app_id: str) -> dict:
         return self._http.delete(f"/api/organizations/{org_id}/applications/{app_id}")
@@ -95,3 +98,98 @@ class ApplicationsService:
 
     def preview_email_template(self, org_id: str, template_type: str, **kwargs: Any) -> dict:
         return self._http.post(f"/api/organizations/{org_id}/email-templates/{template_type}/preview", json=kwargs)
+
+
+class AsyncApplicationsService:
+    """Async variant of :class:`ApplicationsService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    # --- Authz applications ---
+
+    async def create(
+        self,
+        tenant_id: str,
+        name: str,
+        application_type: str,
+        redirect_uris: builtins.list[str],
+        allowed_scopes: builtins.list[str],
+        **kwargs: Any,
+    ) -> dict:
+        body: dict[str, Any] = {
+            "tenant_id": tenant_id,
+            "name": name,
+            "application_type": application_type,
+            "redirect_uris": redirect_uris,
+            "allowed_scopes": allowed_scopes,
+            **kwargs,
+        }
+        return await self._http.post("/api/applications", json=body)
+
+    async def list(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/applications")
+
+    async def get(self, app_id: str, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/applications/{app_id}/tenants/{tenant_id}")
+
+    async def update(self, app_id: str, tenant_id: str, **kwargs: Any) -> dict:
+        return await self._http.post(f"/api/applications/{app_id}/tenants/{tenant_id}", json=kwargs)
+
+    async def rotate_secret(self, app_id: str, tenant_id: str) -> dict:
+        return await self._http.post_empty(f"/api/applications/{app_id}/tenants/{tenant_id}/rotate-secret")
+
+    async def delete(self, app_id: str, tenant_id: str) -> dict:
+        return await self._http.delete(f"/api/applications/{app_id}/tenants/{tenant_id}")
+
+    async def authenticate(self, client_id: str, client_secret: str) -> dict:
+        return await self._http.post("/api/applications/authenticate", json={
+            "client_id": client_id,
+            "client_secret": client_secret,
+        })
+
+    # --- OAuth apps (org-scoped) ---
+
+    async def create_oauth_app(self, org_id: str, name: str, slug: str, app_type: str, callback_urls: builtins.list[str], **kwargs: Any) -> dict:
+        body: dict[str, Any] = {
+            "name": name,
+            "slug": slug,
+            "app_type": app_type,
+            "callback_urls": callback_urls,
+            **kwargs,
+        }
+        return await self._http.post(f"/api/organizations/{org_id}/applications", json=body)
+
+    async def list_oauth_apps(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/applications")
+
+    async def get_oauth_app(self, org_id: str, app_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/applications/{app_id}")
+
+    async def update_oauth_app(self, org_id: str, app_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/applications/{app_id}", json=kwargs)
+
+    async def rotate_oauth_secret(self, org_id: str, app_id: str) -> dict:
+        return await self._http.post_empty(f"/api/organizations/{org_id}/applications/{app_id}/rotate-secret")
+
+    async def delete_oauth_app(self, org_id: str, app_id: str) -> dict:
+        return await self._http.delete(f"/api/organizations/{org_id}/applications/{app_id}")
+
+    # --- Email templates ---
+
+    async def list_email_templates(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/email-templates")
+
+    async def get_email_template(self, org_id: str, template_type: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/email-templates/{template_type}")
+
+    async def update_email_template(self, org_id: str, template_type: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/email-templates/{template_type}", json=kwargs)
+
+    async def delete_email_template(self, org_id: str, template_type: str) -> dict:
+        return await self._http.delete(f"/api/organizations/{org_id}/email-templates/{template_type}")
+
+    async def preview_email_template(self, org_id: str, template_type: str, **kwargs: Any) -> dict:
+        return await self._http.post(f"/api/organizations/{org_id}/email-templates/{template_type}/preview", json=kwargs)
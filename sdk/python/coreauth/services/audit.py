@@ -1,12 +1,17 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import asyncio
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterable, Iterator, Optional
+
+from ._batch import fan_out
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class AuditService:
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
@@ -37,6 +42,17 @@ class AuditService:
             params["offset"] = offset
         return self._http.get("/api/audit/logs", params=params or None)
 
+    def query_pages(self, pages: Iterable[tuple[int, int]], *, max_workers: int = 8, **filters: Any) -> list[dict]:
+        """Fetch several ``(limit, offset)`` pages of :meth:`query` concurrently.
+
+        Requests overlap on the shared connection pool instead of running back to
+        back; results are returned in the order the pages were given.
+        """
+        pages = list(pages)
+        if not pages:
+            return []
+        return fan_out(lambda page: self.query(limit=page[0], offset=page[1], **filters), pages, max_workers)
+
     def get(self, log_id: str) -> dict:
         return self._http.get(f"/api/audit/logs/{log_id}")
 
@@ -49,6 +65,10 @@ class AuditService:
     def export(self) -> dict:
         return self._http.get("/api/audit/export")
 
+    def export_iter(self, from_date: str, to_date: str) -> Iterator[dict]:
+        """Stream an audit export, yielding log records as they arrive."""
+        return self._http.stream_items("/api/audit/export", params={"from_date": from_date, "to_date": to_date})
+
     def stats(self) -> dict:
         return self._http.get("/api/audit/stats")
 
@@ -57,3 +77,73 @@ class AuditService:
 
     def security_audit_logs(self) -> dict:
         return self._http.get("/api/security/audit-logs")
+
+
+class AsyncAuditService:
+    """Async variant of :class:`AuditService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    async def query(
+        self,
+        tenant_id: Optional[str] = None,
+        event_types: Optional[str] = None,
+        user_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> dict:
+        params: dict[str, Any] = {}
+        if tenant_id:
+            params["tenant_id"] = tenant_id
+        if event_types:
+            params["event_types"] = event_types
+        if user_id:
+            params["user_id"] = user_id
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        return await self._http.get("/api/audit/logs", params=params or None)
+
+    async def query_pages(self, pages: Iterable[tuple[int, int]], **filters: Any) -> list[dict]:
+        """Fetch several ``(limit, offset)`` pages of :meth:`query` concurrently.
+
+        Results are returned in the order the pages were given.
+        """
+        return list(
+            await asyncio.gather(*(self.query(limit=limit, offset=offset, **filters) for limit, offset in pages))
+        )
+
+    async def get(self, log_id: str) -> dict:
+        return await self._http.get(f"/api/audit/logs/{log_id}")
+
+    async def security_events(self) -> dict:
+        return await self._http.get("/api/audit/security-events")
+
+    async def failed_logins(self, user_id: str) -> dict:
+        return await self._http.get(f"/api/audit/failed-logins/{user_id}")
+
+    async def export(self) -> dict:
+        return await self._http.get("/api/audit/export")
+
+    def export_iter(self, from_date: str, to_date: str) -> AsyncIterator[dict]:
+        """Stream an audit export, yielding log records as they arrive."""
+        return self._http.stream_items("/api/audit/export", params={"from_date": from_date, "to_date": to_date})
+
+    async def stats(self) -> dict:
+        return await self._http.get("/api/audit/stats")
+
+    async def login_history(self) -> dict:
+        return await self._http.get("/api/login-history")
+
+    async def security_audit_logs(self) -> dict:
+        return await self._http.get("/api/security/audit-logs")
@@ -2,19 +2,22 @@
 
 from __future__ import annotations
 
+import builtins
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class ConnectionsService:
     """Manage authentication connections (SSO, OIDC, SAML, social, database)."""
 
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
-    def list(self, org_id: str) -> list[dict[str, Any]]:
+    def list(self, org_id: str) -> builtins.list[dict[str, Any]]:
         """List all connections for an organization (includes platform connections)."""
         return self._http.get(f"/api/organizations/{org_id}/connections")
 
@@ -34,14 +37,55 @@ class ConnectionsService:
         """Delete a connection."""
         self._http.delete(f"/api/organizations/{org_id}/connections/{connection_id}")
 
-    def get_auth_methods(self, org_id: str) -> list[dict[str, Any]]:
+    def get_auth_methods(self, org_id: str) -> builtins.list[dict[str, Any]]:
         """Get available authentication methods for an organization."""
         return self._http.get(f"/api/organizations/{org_id}/connections/auth-methods")
 
-    def list_all(self) -> list[dict[str, Any]]:
+    def list_all(self) -> builtins.list[dict[str, Any]]:
         """Admin: list all connections across all organizations."""
         return self._http.get("/api/admin/connections")
 
     def create_platform(self, data: dict[str, Any]) -> dict[str, Any]:
         """Admin: create a platform-scoped connection."""
         return self._http.post("/api/admin/connections", data)
+
+
+class AsyncConnectionsService:
+    """Async variant of :class:`ConnectionsService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    async def list(self, org_id: str) -> builtins.list[dict[str, Any]]:
+        """List all connections for an organization (includes platform connections)."""
+        return await self._http.get(f"/api/organizations/{org_id}/connections")
+
+    async def create(self, org_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Create an organization-scoped connection."""
+        return await self._http.post(f"/api/organizations/{org_id}/connections", data)
+
+    async def get(self, org_id: str, connection_id: str) -> dict[str, Any]:
+        """Get a specific connection."""
+        return await self._http.get(f"/api/organizations/{org_id}/connections/{connection_id}")
+
+    async def update(self, org_id: str, connection_id: str, data: dict[str, Any]) -> dict[str, Any]:
+        """Update a connection."""
+        return await self._http.put(f"/api/organizations/{org_id}/connections/{connection_id}", data)
+
+    async def delete(self, org_id: str, connection_id: str) -> None:
+        """Delete a connection."""
+        await self._http.delete(f"/api/organizations/{org_id}/connections/{connection_id}")
+
+    async def get_auth_methods(self, org_id: str) -> builtins.list[dict[str, Any]]:
+        """Get available authentication methods for an organization."""
+        return await self._http.get(f"/api/organizations/{org_id}/connections/auth-methods")
+
+    async def list_all(self) -> builtins.list[dict[str, Any]]:
+        """Admin: list all connections across all organizations."""
+        return await self._http.get("/api/admin/connections")
+
+    async def create_platform(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Admin: create a platform-scoped connection."""
+        return await self._http.post("/api/admin/connections", data)
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
+import asyncio
+import builtins
+from functools import partial
 from typing import TYPE_CHECKING, Any, Optional
 
+from ..exceptions import NotFoundError
+from ._batch import fan_out, route_missing
+
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class GroupsService:
+    __slots__ = ("_http", "_unsupported")
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
+        # Batch endpoints the server answered with a routing 404; skipped afterwards.
+        self._unsupported: set[str] = set()
 
     # --- Groups ---
 
@@ -45,6 +55,65 @@ class GroupsService:
     def remove_member(self, tenant_id: str, group_id: str, user_id: str) -> dict:
         return self._http.delete(f"/api/tenants/{tenant_id}/groups/{group_id}/members/{user_id}")
 
+    def add_members(
+        self,
+        tenant_id: str,
+        group_id: str,
+        members: builtins.list[dict[str, Any]],
+        *,
+        chunk_size: int = 500,
+        max_workers: int = 8,
+    ) -> builtins.list[dict]:
+        """Add several members to a group, ``chunk_size`` per request.
+
+        Each entry takes the keyword arguments of :meth:`add_member` (``user_id``
+        and optionally ``role``). Servers without the batch endpoint get the
+        individual calls issued concurrently. Returns the response of every
+        request made.
+        """
+        path = f"/api/tenants/{tenant_id}/groups/{group_id}/members:batch"
+        results = self._post_chunks(path, "members", members, chunk_size)
+        if results is not None:
+            return results
+        return fan_out(lambda m: self.add_member(tenant_id, group_id, **m), members, max_workers)
+
+    def remove_members(
+        self,
+        tenant_id: str,
+        group_id: str,
+        user_ids: builtins.list[str],
+        *,
+        chunk_size: int = 500,
+        max_workers: int = 8,
+    ) -> builtins.list[dict]:
+        """Remove several users from a group; see :meth:`add_members`."""
+        path = f"/api/tenants/{tenant_id}/groups/{group_id}/members:batchDelete"
+        results = self._post_chunks(path, "user_ids", user_ids, chunk_size)
+        if results is not None:
+            return results
+        return fan_out(partial(self.remove_member, tenant_id, group_id), user_ids, max_workers)
+
+    def _post_chunks(
+        self, path: str, key: str, items: builtins.list[Any], chunk_size: int
+    ) -> Optional[builtins.list[dict]]:
+        """POST ``items`` to a batch endpoint in chunks; None if the server lacks it."""
+        if not items:
+            return []
+        route = path.rsplit("/", 1)[-1]
+        if route in self._unsupported:
+            return None
+        results: builtins.list[dict] = []
+        try:
+            for start in range(0, len(items), chunk_size):
+                results.append(self._http.post(path, json={key: items[start : start + chunk_size]}))
+        except NotFoundError as e:
+            # Only the first chunk can hit a missing route; later ones were accepted.
+            if results or not route_missing(e):
+                raise
+            self._unsupported.add(route)
+            return None
+        return results
+
     # --- Roles ---
 
     def assign_role(self, tenant_id: str, group_id: str, role_id: str) -> dict:
@@ -74,7 +143,7 @@ class GroupsService:
         return self._http.delete(f"/api/tenants/{tenant_id}/invitations/{invitation_id}")
 
     def resend_invitation(self, tenant_id: str, invitation_id: str) -> dict:
-        return self._http.post(f"/api/tenants/{tenant_id}/invitations/{invitation_id}/resend")
+        return self._http.post_empty(f"/api/tenants/{tenant_id}/invitations/{invitation_id}/resend")
 
     def verify_invitation(self, token: str) -> dict:
         return self._http.get("/api/invitations/verify", params={"token": token})
@@ -88,3 +157,150 @@ class GroupsService:
         if metadata:
             body["metadata"] = metadata
         return self._http.post("/api/invitations/accept", json=body)
+
+
+class AsyncGroupsService:
+    """Async variant of :class:`GroupsService`."""
+
+    __slots__ = ("_http", "_unsupported")
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+        # Batch endpoints the server answered with a routing 404; skipped afterwards.
+        self._unsupported: set[str] = set()
+
+    # --- Groups ---
+
+    async def create(self, tenant_id: str, name: str, **kwargs: Any) -> dict:
+        body: dict[str, Any] = {"name": name, **kwargs}
+        return await self._http.post(f"/api/tenants/{tenant_id}/groups", json=body)
+
+    async def list(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/groups")
+
+    async def get(self, tenant_id: str, group_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/groups/{group_id}")
+
+    async def update(self, tenant_id: str, group_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/tenants/{tenant_id}/groups/{group_id}", json=kwargs)
+
+    async def delete(self, tenant_id: str, group_id: str) -> dict:
+        return await self._http.delete(f"/api/tenants/{tenant_id}/groups/{group_id}")
+
+    # --- Members ---
+
+    async def add_member(self, tenant_id: str, group_id: str, user_id: str, role: Optional[str] = None) -> dict:
+        body: dict[str, Any] = {"user_id": user_id}
+        if role:
+            body["role"] = role
+        return await self._http.post(f"/api/tenants/{tenant_id}/groups/{group_id}/members", json=body)
+
+    async def list_members(self, tenant_id: str, group_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/groups/{group_id}/members")
+
+    async def update_member(self, tenant_id: str, group_id: str, user_id: str, **kwargs: Any) -> dict:
+        return await self._http.patch(f"/api/tenants/{tenant_id}/groups/{group_id}/members/{user_id}", json=kwargs)
+
+    async def remove_member(self, tenant_id: str, group_id: str, user_id: str) -> dict:
+        return await self._http.delete(f"/api/tenants/{tenant_id}/groups/{group_id}/members/{user_id}")
+
+    async def add_members(
+        self,
+        tenant_id: str,
+        group_id: str,
+        members: builtins.list[dict[str, Any]],
+        *,
+        chunk_size: int = 500,
+    ) -> builtins.list[dict]:
+        """Add several members to a group, ``chunk_size`` per request.
+
+        Each entry takes the keyword arguments of :meth:`add_member` (``user_id``
+        and optionally ``role``). Servers without the batch endpoint get the
+        individual calls issued concurrently. Returns the response of every
+        request made.
+        """
+        path = f"/api/tenants/{tenant_id}/groups/{group_id}/members:batch"
+        results = await self._post_chunks(path, "members", members, chunk_size)
+        if results is not None:
+            return results
+        return list(await asyncio.gather(*(self.add_member(tenant_id, group_id, **m) for m in members)))
+
+    async def remove_members(
+        self,
+        tenant_id: str,
+        group_id: str,
+        user_ids: builtins.list[str],
+        *,
+        chunk_size: int = 500,
+    ) -> builtins.list[dict]:
+        """Remove several users from a group; see :meth:`add_members`."""
+        path = f"/api/tenants/{tenant_id}/groups/{group_id}/members:batchDelete"
+        results = await self._post_chunks(path, "user_ids", user_ids, chunk_size)
+        if results is not None:
+            return results
+        return list(await asyncio.gather(*(self.remove_member(tenant_id, group_id, u) for u in user_ids)))
+
+    async def _post_chunks(
+        self, path: str, key: str, items: builtins.list[Any], chunk_size: int
+    ) -> Optional[builtins.list[dict]]:
+        """POST ``items`` to a batch endpoint in chunks; None if the server lacks it."""
+        if not items:
+            return []
+        route = path.rsplit("/", 1)[-1]
+        if route in self._unsupported:
+            return None
+        results: builtins.list[dict] = []
+        try:
+            for start in range(0, len(items), chunk_size):
+                results.append(await self._http.post(path, json={key: items[start : start + chunk_size]}))
+        except NotFoundError as e:
+            # Only the first chunk can hit a missing route; later ones were accepted.
+            if results or not route_missing(e):
+                raise
+            self._unsupported.add(route)
+            return None
+        return results
+
+    # --- Roles ---
+
+    async def assign_role(self, tenant_id: str, group_id: str, role_id: str) -> dict:
+        return await self._http.post(f"/api/tenants/{tenant_id}/groups/{group_id}/roles", json={"role_id": role_id})
+
+    async def list_roles(self, tenant_id: str, group_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/groups/{group_id}/roles")
+
+    async def remove_role(self, tenant_id: str, group_id: str, role_id: str) -> dict:
+        return await self._http.delete(f"/api/tenants/{tenant_id}/groups/{group_id}/roles/{role_id}")
+
+    # --- User groups ---
+
+    async def get_user_groups(self, tenant_id: str, user_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/users/{user_id}/groups")
+
+    # --- Invitations ---
+
+    async def create_invitation(self, tenant_id: str, email: str, **kwargs: Any) -> dict:
+        body: dict[str, Any] = {"email": email, **kwargs}
+        return await self._http.post(f"/api/tenants/{tenant_id}/invitations", json=body)
+
+    async def list_invitations(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/invitations")
+
+    async def revoke_invitation(self, tenant_id: str, invitation_id: str) -> dict:
+        return await self._http.delete(f"/api/tenants/{tenant_id}/invitations/{invitation_id}")
+
+    async def resend_invitation(self, tenant_id: str, invitation_id: str) -> dict:
+        return await self._http.post_empty(f"/api/tenants/{tenant_id}/invitations/{invitation_id}/resend")
+
+    async def verify_invitation(self, token: str) -> dict:
+        return await self._http.get("/api/invitations/verify", params={"token": token})
+
+    async def accept_invitation(self, token: str, password: str, full_name: str, metadata: Optional[dict] = None) -> dict:
+        body: dict[str, Any] = {
+            "token": token,
+            "password": password,
+            "full_name": full_name,
+        }
+        if metadata:
+            body["metadata"] = metadata
+        return await self._http.post("/api/invitations/accept", json=body)
@@ -1,21 +1,55 @@
 from __future__ import annotations
 
+import copy
+import time
 from typing import TYPE_CHECKING, Any, Optional
 from urllib.parse import urlencode
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
+
+# Seconds the discovery document and JWKS are served from memory before refetching.
+DISCOVERY_TTL = 300.0
+JWKS_TTL = 600.0
+
+_DISCOVERY_PATH = "/.well-known/openid-configuration"
+_JWKS_PATH = "/.well-known/jwks.json"
 
 
 class OAuth2Service:
+    __slots__ = ("_http", "_cache", "_authorize_prefix")
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
+        self._cache: dict[str, tuple[Any, float]] = {}
+        self._authorize_prefix = f"{http._base_url}/authorize?"
+
+    def _cached_get(self, path: str, ttl: float) -> Any:
+        # Concurrent misses are coalesced into one request by the transport.
+        # Callers get their own copy, so mutating a result cannot corrupt the
+        # cached document (the JWKS ``keys`` list included) for other callers.
+        hit = self._cache.get(path)
+        if hit is not None and hit[1] > time.monotonic():
+            return copy.deepcopy(hit[0])
+        value = self._http.get(path)
+        self._cache[path] = (value, time.monotonic() + ttl)
+        return copy.deepcopy(value)
 
     def discovery(self) -> dict:
-        return self._http.get("/.well-known/openid-configuration")
+        """OpenID provider metadata, cached for ``DISCOVERY_TTL`` seconds."""
+        return self._cached_get(_DISCOVERY_PATH, DISCOVERY_TTL)
 
     def jwks(self) -> dict:
-        return self._http.get("/.well-known/jwks.json")
+        """Signing keys, cached for ``JWKS_TTL`` seconds."""
+        return self._cached_get(_JWKS_PATH, JWKS_TTL)
+
+    def invalidate_discovery(self) -> None:
+        """Drop the cached discovery document so the next call refetches it."""
+        self._cache.pop(_DISCOVERY_PATH, None)
+
+    def invalidate_jwks(self) -> None:
+        """Drop the cached JWKS, e.g. after a key rotation or an unknown ``kid``."""
+        self._cache.pop(_JWKS_PATH, None)
 
     def authorize(
         self,
@@ -32,8 +66,8 @@ class OAuth2Service:
             "scope": scope,
             **params,
         }
-        base_url = self._http._base_url.rstrip("/")
-        return f"{base_url}/authorize?{urlencode(query)}"
+        # doseq lets list-valued params (e.g. several prompt values) repeat the key.
+        return self._authorize_prefix + urlencode(query, doseq=True)
 
     def token(self, grant_type: str, **kwargs: Any) -> dict:
         data = {"grant_type": grant_type, **kwargs}
@@ -68,3 +102,93 @@ class OAuth2Service:
         if state:
             params["state"] = state
         return self._http.get("/logout", params=params or None)
+
+
+class AsyncOAuth2Service:
+    """Async variant of :class:`OAuth2Service`."""
+
+    __slots__ = ("_http", "_cache", "_authorize_prefix")
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+        self._cache: dict[str, tuple[Any, float]] = {}
+        self._authorize_prefix = f"{http._base_url}/authorize?"
+
+    async def _cached_get(self, path: str, ttl: float) -> Any:
+        # Concurrent misses are coalesced into one request by the transport.
+        # Callers get their own copy, so mutating a result cannot corrupt the
+        # cached document (the JWKS ``keys`` list included) for other callers.
+        hit = self._cache.get(path)
+        if hit is not None and hit[1] > time.monotonic():
+            return copy.deepcopy(hit[0])
+        value = await self._http.get(path)
+        self._cache[path] = (value, time.monotonic() + ttl)
+        return copy.deepcopy(value)
+
+    async def discovery(self) -> dict:
+        """OpenID provider metadata, cached for ``DISCOVERY_TTL`` seconds."""
+        return await self._cached_get(_DISCOVERY_PATH, DISCOVERY_TTL)
+
+    async def jwks(self) -> dict:
+        """Signing keys, cached for ``JWKS_TTL`` seconds."""
+        return await self._cached_get(_JWKS_PATH, JWKS_TTL)
+
+    def invalidate_discovery(self) -> None:
+        """Drop the cached discovery document so the next call refetches it."""
+        self._cache.pop(_DISCOVERY_PATH, None)
+
+    def invalidate_jwks(self) -> None:
+        """Drop the cached JWKS, e.g. after a key rotation or an unknown ``kid``."""
+        self._cache.pop(_JWKS_PATH, None)
+
+    def authorize(
+        self,
+        client_id: str,
+        redirect_uri: str,
+        response_type: str = "code",
+        scope: str = "openid",
+        **params: Any,
+    ) -> str:
+        query: dict[str, Any] = {
+            "client_id": client_id,
+            "redirect_uri": redirect_uri,
+            "response_type": response_type,
+            "scope": scope,
+            **params,
+        }
+        # doseq lets list-valued params (e.g. several prompt values) repeat the key.
+        return self._authorize_prefix + urlencode(query, doseq=True)
+
+    async def token(self, grant_type: str, **kwargs: Any) -> dict:
+        data = {"grant_type": grant_type, **kwargs}
+        return await self._http.post_form("/oauth/token", data=data)
+
+    async def userinfo(self) -> dict:
+        return await self._http.get("/userinfo")
+
+    async def revoke(self, token: str, token_type_hint: Optional[str] = None) -> dict:
+        data: dict[str, str] = {"token": token}
+        if token_type_hint:
+            data["token_type_hint"] = token_type_hint
+        return await self._http.post_form("/oauth/revoke", data=data)
+
+    async def introspect(self, token: str, token_type_hint: Optional[str] = None) -> dict:
+        data: dict[str, str] = {"token": token}
+        if token_type_hint:
+            data["token_type_hint"] = token_type_hint
+        return await self._http.post_form("/oauth/introspect", data=data)
+
+    async def oidc_logout(
+        self,
+        id_token_hint: Optional[str] = None,
+        post_logout_redirect_uri: Optional[str] = None,
+        state: Optional[str] = None,
+    ) -> dict:
+        params: dict[str, str] = {}
+        if id_token_hint:
+            params["id_token_hint"] = id_token_hint
+        if post_logout_redirect_uri:
+            params["post_logout_redirect_uri"] = post_logout_redirect_uri
+        if state:
+            params["state"] = state
+        return await self._http.get("/logout", params=params or None)
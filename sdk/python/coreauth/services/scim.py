@@ -1,12 +1,26 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional
+
+from .._scim import GROUP_SCHEMAS, PATCH_OP_SCHEMAS, USER_SCHEMAS
+from ._pagination import Page, aiter_pages, iter_pages
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
+
+
+def _scim_page(page: dict, start_index: int) -> Page:
+    """Split a SCIM ListResponse into its resources and the next ``startIndex``."""
+    resources = page.get("Resources") or []
+    next_index = start_index + len(resources)
+    if not resources or next_index > page.get("totalResults", 0):
+        return resources, None
+    return resources, next_index
 
 
 class ScimService:
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
@@ -39,17 +53,21 @@ class ScimService:
             p["startIndex"] = start_index
         return self._http.get("/scim/v2/Users", params=p or None)
 
+    def iter_users(self, filter: Optional[str] = None, page_size: int = 100, **params: Any) -> Iterator[dict]:
+        """Iterate over every SCIM user, fetching the next page while one is consumed."""
+        return iter_pages(lambda start: _scim_page(self.list_users(filter, page_size, start, **params), start), 1)
+
     def create_user(self, **kwargs: Any) -> dict:
-        return self._http.post("/scim/v2/Users", json=kwargs)
+        return self._http.post("/scim/v2/Users", json={"schemas": USER_SCHEMAS, **kwargs})
 
     def get_user(self, user_id: str) -> dict:
         return self._http.get(f"/scim/v2/Users/{user_id}")
 
     def replace_user(self, user_id: str, **kwargs: Any) -> dict:
-        return self._http.put(f"/scim/v2/Users/{user_id}", json=kwargs)
+        return self._http.put(f"/scim/v2/Users/{user_id}", json={"schemas": USER_SCHEMAS, **kwargs})
 
     def patch_user(self, user_id: str, operations: list[dict]) -> dict:
-        return self._http.patch(f"/scim/v2/Users/{user_id}", json={"Operations": operations})
+        return self._http.patch(f"/scim/v2/Users/{user_id}", json={"schemas": PATCH_OP_SCHEMAS, "Operations": operations})
 
     def delete_user(self, user_id: str) -> dict:
         return self._http.delete(f"/scim/v2/Users/{user_id}")
@@ -72,14 +90,18 @@ class ScimService:
             p["startIndex"] = start_index
         return self._http.get("/scim/v2/Groups", params=p or None)
 
+    def iter_groups(self, filter: Optional[str] = None, page_size: int = 100, **params: Any) -> Iterator[dict]:
+        """Iterate over every SCIM group, fetching the next page while one is consumed."""
+        return iter_pages(lambda start: _scim_page(self.list_scim_groups(filter, page_size, start, **params), start), 1)
+
     def create_scim_group(self, **kwargs: Any) -> dict:
-        return self._http.post("/scim/v2/Groups", json=kwargs)
+        return self._http.post("/scim/v2/Groups", json={"schemas": GROUP_SCHEMAS, **kwargs})
 
     def get_scim_group(self, group_id: str) -> dict:
         return self._http.get(f"/scim/v2/Groups/{group_id}")
 
     def patch_scim_group(self, group_id: str, operations: list[dict]) -> dict:
-        return self._http.patch(f"/scim/v2/Groups/{group_id}", json={"Operations": operations})
+        return self._http.patch(f"/scim/v2/Groups/{group_id}", json={"schemas": PATCH_OP_SCHEMAS, "Operations": operations})
 
     def delete_scim_group(self, group_id: str) -> dict:
         return self._http.delete(f"/scim/v2/Groups/{group_id}")
@@ -110,7 +132,7 @@ class ScimService:
         return self._http.delete(f"/api/sessions/{session_id}")
 
     def revoke_all_sessions(self) -> dict:
-        return self._http.post("/api/sessions/revoke-all")
+        return self._http.post_empty("/api/sessions/revoke-all")
 
     # --- OIDC Providers ---
 
@@ -137,3 +159,156 @@ class ScimService:
 
     def sso_check(self, email: str) -> dict:
         return self._http.get("/api/oidc/sso-check", params={"email": email})
+
+
+class AsyncScimService:
+    """Async variant of :class:`ScimService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    # --- SCIM Config (public) ---
+
+    async def get_config(self) -> dict:
+        return await self._http.get("/scim/v2/ServiceProviderConfig")
+
+    async def get_resource_types(self) -> dict:
+        return await self._http.get("/scim/v2/ResourceTypes")
+
+    async def get_schemas(self) -> dict:
+        return await self._http.get("/scim/v2/Schemas")
+
+    # --- SCIM Users ---
+
+    async def list_users(
+        self,
+        filter: Optional[str] = None,
+        count: Optional[int] = None,
+        start_index: Optional[int] = None,
+        **params: Any,
+    ) -> dict:
+        p: dict[str, Any] = {**params}
+        if filter:
+            p["filter"] = filter
+        if count is not None:
+            p["count"] = count
+        if start_index is not None:
+            p["startIndex"] = start_index
+        return await self._http.get("/scim/v2/Users", params=p or None)
+
+    def iter_users(self, filter: Optional[str] = None, page_size: int = 100, **params: Any) -> AsyncIterator[dict]:
+        """Iterate over every SCIM user, fetching the next page while one is consumed."""
+
+        async def fetch(start: int) -> Page:
+            return _scim_page(await self.list_users(filter, page_size, start, **params), start)
+
+        return aiter_pages(fetch, 1)
+
+    async def create_user(self, **kwargs: Any) -> dict:
+        return await self._http.post("/scim/v2/Users", json={"schemas": USER_SCHEMAS, **kwargs})
+
+    async def get_user(self, user_id: str) -> dict:
+        return await self._http.get(f"/scim/v2/Users/{user_id}")
+
+    async def replace_user(self, user_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/scim/v2/Users/{user_id}", json={"schemas": USER_SCHEMAS, **kwargs})
+
+    async def patch_user(self, user_id: str, operations: list[dict]) -> dict:
+        return await self._http.patch(f"/scim/v2/Users/{user_id}", json={"schemas": PATCH_OP_SCHEMAS, "Operations": operations})
+
+    async def delete_user(self, user_id: str) -> dict:
+        return await self._http.delete(f"/scim/v2/Users/{user_id}")
+
+    # --- SCIM Groups ---
+
+    async def list_scim_groups(
+        self,
+        filter: Optional[str] = None,
+        count: Optional[int] = None,
+        start_index: Optional[int] = None,
+        **params: Any,
+    ) -> dict:
+        p: dict[str, Any] = {**params}
+        if filter:
+            p["filter"] = filter
+        if count is not None:
+            p["count"] = count
+        if start_index is not None:
+            p["startIndex"] = start_index
+        return await self._http.get("/scim/v2/Groups", params=p or None)
+
+    def iter_groups(self, filter: Optional[str] = None, page_size: int = 100, **params: Any) -> AsyncIterator[dict]:
+        """Iterate over every SCIM group, fetching the next page while one is consumed."""
+
+        async def fetch(start: int) -> Page:
+            return _scim_page(await self.list_scim_groups(filter, page_size, start, **params), start)
+
+        return aiter_pages(fetch, 1)
+
+    async def create_scim_group(self, **kwargs: Any) -> dict:
+        return await self._http.post("/scim/v2/Groups", json={"schemas": GROUP_SCHEMAS, **kwargs})
+
+    async def get_scim_group(self, group_id: str) -> dict:
+        return await self._http.get(f"/scim/v2/Groups/{group_id}")
+
+    async def patch_scim_group(self, group_id: str, operations: list[dict]) -> dict:
+        return await self._http.patch(f"/scim/v2/Groups/{group_id}", json={"schemas": PATCH_OP_SCHEMAS, "Operations": operations})
+
+    async def delete_scim_group(self, group_id: str) -> dict:
+        return await self._http.delete(f"/scim/v2/Groups/{group_id}")
+
+    # --- SCIM Tokens ---
+
+    async def list_scim_tokens(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/scim/tokens")
+
+    async def create_scim_token(self, org_id: str, name: str, expires_at: Optional[str] = None) -> dict:
+        body: dict[str, Any] = {"name": name}
+        if expires_at:
+            body["expires_at"] = expires_at
+        return await self._http.post(f"/api/organizations/{org_id}/scim/tokens", json=body)
+
+    async def revoke_scim_token(self, org_id: str, token_id: str) -> dict:
+        return await self._http.delete(f"/api/organizations/{org_id}/scim/tokens/{token_id}")
+
+    # --- Sessions ---
+
+    async def list_sessions(self, user_id: Optional[str] = None) -> dict:
+        params: dict[str, Any] = {}
+        if user_id:
+            params["user_id"] = user_id
+        return await self._http.get("/api/sessions", params=params or None)
+
+    async def revoke_session(self, session_id: str) -> dict:
+        return await self._http.delete(f"/api/sessions/{session_id}")
+
+    async def revoke_all_sessions(self) -> dict:
+        return await self._http.post_empty("/api/sessions/revoke-all")
+
+    # --- OIDC Providers ---
+
+    async def list_oidc_providers(self, tenant_id: str) -> dict:
+        return await self._http.get("/api/oidc/providers", params={"tenant_id": tenant_id})
+
+    async def create_oidc_provider(self, **kwargs: Any) -> dict:
+        return await self._http.post("/api/oidc/providers", json=kwargs)
+
+    async def update_oidc_provider(self, provider_id: str, **kwargs: Any) -> dict:
+        return await self._http.patch(f"/api/oidc/providers/{provider_id}", json=kwargs)
+
+    async def delete_oidc_provider(self, provider_id: str) -> dict:
+        return await self._http.delete(f"/api/oidc/providers/{provider_id}")
+
+    async def list_public_providers(self, tenant_id: str) -> dict:
+        return await self._http.get("/api/oidc/providers/public", params={"tenant_id": tenant_id})
+
+    async def list_provider_templates(self) -> dict:
+        return await self._http.get("/api/oidc/templates")
+
+    async def get_provider_template(self, provider_type: str) -> dict:
+        return await self._http.get(f"/api/oidc/templates/{provider_type}")
+
+    async def sso_check(self, email: str) -> dict:
+        return await self._http.get("/api/oidc/sso-check", params={"email": email})
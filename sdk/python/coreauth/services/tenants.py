@@ -3,10 +3,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
 
 
 class TenantsService:
+    __slots__ = ("_http",)
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
 
@@ -50,3 +52,53 @@ class TenantsService:
 
     def update_branding(self, org_id: str, **kwargs: Any) -> dict:
         return self._http.put(f"/api/organizations/{org_id}/branding", json=kwargs)
+
+
+class AsyncTenantsService:
+    """Async variant of :class:`TenantsService`."""
+
+    __slots__ = ("_http",)
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+
+    async def create(
+        self,
+        name: str,
+        slug: str,
+        admin_email: str,
+        admin_password: str,
+        admin_full_name: Optional[str] = None,
+        **kwargs: Any,
+    ) -> dict:
+        body: dict[str, Any] = {
+            "name": name,
+            "slug": slug,
+            "admin_email": admin_email,
+            "admin_password": admin_password,
+            **kwargs,
+        }
+        if admin_full_name:
+            body["admin_full_name"] = admin_full_name
+        return await self._http.post("/api/tenants", json=body)
+
+    async def get_by_slug(self, slug: str) -> dict:
+        return await self._http.get(f"/api/organizations/by-slug/{slug}")
+
+    async def list_users(self, tenant_id: str) -> dict:
+        return await self._http.get(f"/api/tenants/{tenant_id}/users")
+
+    async def update_user_role(self, tenant_id: str, user_id: str, role: str) -> dict:
+        return await self._http.put(f"/api/tenants/{tenant_id}/users/{user_id}/role", json={"role": role})
+
+    async def get_security(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/security")
+
+    async def update_security(self, org_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/security", json=kwargs)
+
+    async def get_branding(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/branding")
+
+    async def update_branding(self, org_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/branding", json=kwargs)
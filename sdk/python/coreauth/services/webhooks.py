@@ -1,14 +1,75 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Optional
+import asyncio
+import builtins
+import time
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, AsyncIterator, Iterator, Optional
+
+from ..exceptions import NotFoundError
+from ._batch import route_missing
+from ._pagination import Page, aiter_pages, iter_pages
 
 if TYPE_CHECKING:
-    from .._http import HttpClient
+    from .._http import AsyncHttpClient, HttpClient
+
+# The deliveries endpoint caps ``limit`` at this many rows.
+MAX_DELIVERY_PAGE_SIZE = 100
+
+
+def _created_at(delivery: dict) -> Optional[datetime]:
+    value = delivery.get("created_at")
+    return datetime.fromisoformat(value.replace("Z", "+00:00")) if value else None
+
+
+class _DeliveryCursor:
+    """High-water mark of the deliveries a polling ``stream_deliveries`` has handed out.
+
+    Tracks the newest ``created_at`` seen and the ids carrying it. A poll pages
+    through the newest-first listing until it reaches a delivery at or below the
+    mark, so a burst larger than one page between polls is not lost.
+    """
+
+    __slots__ = ("_newest", "_seen")
+
+    def __init__(self) -> None:
+        self._newest: Optional[datetime] = None
+        self._seen: set[str] = set()
+
+    def unseen(self, page: builtins.list[dict]) -> tuple[builtins.list[dict], bool]:
+        """Return the deliveries in ``page`` above the mark, and whether the mark was reached."""
+        for i, delivery in enumerate(page):
+            if delivery["id"] in self._seen:
+                return page[:i], True
+            created_at = _created_at(delivery)
+            if self._newest is not None and created_at is not None and created_at < self._newest:
+                return page[:i], True
+        return page, False
+
+    def advance(self, fresh: builtins.list[dict]) -> builtins.list[dict]:
+        """Move the mark past ``fresh`` (newest first); returns it without duplicates.
+
+        Rows inserted while a poll pages through the listing shift later pages
+        down, so the same delivery can turn up twice in one poll.
+        """
+        fresh = builtins.list({d["id"]: d for d in fresh}.values())
+        if fresh:
+            newest = _created_at(fresh[0])
+            ids = {d["id"] for d in fresh if _created_at(d) == newest}
+            if newest is not None and newest == self._newest:
+                self._seen |= ids
+            else:
+                self._newest, self._seen = newest, ids
+        return fresh
 
 
 class WebhooksService:
+    __slots__ = ("_http", "_unsupported")
+
     def __init__(self, http: HttpClient) -> None:
         self._http = http
+        # Endpoints the server answered with a routing 404; skipped afterwards.
+        self._unsupported: set[str] = set()
 
     def create(self, org_id: str, name: str, url: str, events: list[str], is_enabled: bool = False, **kwargs: Any) -> dict:
         body: dict[str, Any] = {
@@ -33,7 +94,7 @@ class WebhooksService:
         return self._http.delete(f"/api/organizations/{org_id}/webhooks/{webhook_id}")
 
     def rotate_secret(self, org_id: str, webhook_id: str) -> dict:
-        return self._http.post(f"/api/organizations/{org_id}/webhooks/{webhook_id}/rotate-secret")
+        return self._http.post_empty(f"/api/organizations/{org_id}/webhooks/{webhook_id}/rotate-secret")
 
     def test(self, org_id: str, webhook_id: str, event_type: Optional[str] = None) -> dict:
         body: dict[str, Any] = {}
@@ -41,14 +102,156 @@ class WebhooksService:
             body["event_type"] = event_type
         return self._http.post(f"/api/organizations/{org_id}/webhooks/{webhook_id}/test", json=body or None)
 
-    def list_deliveries(self, org_id: str, webhook_id: str, **params: Any) -> dict:
+    def list_deliveries(self, org_id: str, webhook_id: str, **params: Any) -> builtins.list[dict]:
         return self._http.get(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries", params=params or None)
 
+    def iter_deliveries(self, org_id: str, webhook_id: str, page_size: int = 100, **params: Any) -> Iterator[dict]:
+        """Iterate over every delivery (newest first), fetching the next page while one is consumed."""
+        page_size = min(page_size, MAX_DELIVERY_PAGE_SIZE)
+
+        def fetch(offset: int) -> Page:
+            page = self.list_deliveries(org_id, webhook_id, limit=page_size, offset=offset, **params)
+            return page, offset + len(page) if len(page) >= page_size else None
+
+        return iter_pages(fetch, 0)
+
+    def stream_deliveries(
+        self, org_id: str, webhook_id: str, poll_interval: float = 2.0, page_size: int = 50
+    ) -> Iterator[dict]:
+        """Yield deliveries as they are created, until the consumer stops iterating.
+
+        Uses the server-sent event stream at ``deliveries:stream`` when the server
+        provides it; otherwise polls the newest ``page_size`` deliveries every
+        ``poll_interval`` seconds, paging further back while every row on a page
+        is new, and yields the ones not seen before. ``page_size`` is capped at
+        the server limit of ``MAX_DELIVERY_PAGE_SIZE``.
+        """
+        path = f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries:stream"
+        if "deliveries:stream" not in self._unsupported:
+            try:
+                yield from self._http.stream_events(path)
+                return
+            except NotFoundError as e:
+                if not route_missing(e):
+                    raise
+                self._unsupported.add("deliveries:stream")
+        page_size = min(page_size, MAX_DELIVERY_PAGE_SIZE)
+        cursor = _DeliveryCursor()
+        cursor.advance(self.list_deliveries(org_id, webhook_id, limit=page_size))
+        while True:
+            time.sleep(poll_interval)
+            fresh: builtins.list[dict] = []
+            offset = 0
+            while True:
+                page = self.list_deliveries(org_id, webhook_id, limit=page_size, offset=offset)
+                new, reached = cursor.unseen(page)
+                fresh += new
+                if reached or len(page) < page_size:
+                    break
+                offset += len(page)
+            # Newest first from the server; hand them out in creation order.
+            yield from reversed(cursor.advance(fresh))
+
     def get_delivery(self, org_id: str, webhook_id: str, delivery_id: str) -> dict:
         return self._http.get(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries/{delivery_id}")
 
     def retry_delivery(self, org_id: str, webhook_id: str, delivery_id: str) -> dict:
-        return self._http.post(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries/{delivery_id}/retry")
+        return self._http.post_empty(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries/{delivery_id}/retry")
 
     def list_event_types(self) -> dict:
         return self._http.get("/api/webhooks/event-types")
+
+
+class AsyncWebhooksService:
+    """Async variant of :class:`WebhooksService`."""
+
+    __slots__ = ("_http", "_unsupported")
+
+    def __init__(self, http: AsyncHttpClient) -> None:
+        self._http = http
+        # Endpoints the server answered with a routing 404; skipped afterwards.
+        self._unsupported: set[str] = set()
+
+    async def create(self, org_id: str, name: str, url: str, events: list[str], is_enabled: bool = False, **kwargs: Any) -> dict:
+        body: dict[str, Any] = {
+            "name": name,
+            "url": url,
+            "events": events,
+            "is_enabled": is_enabled,
+            **kwargs,
+        }
+        return await self._http.post(f"/api/organizations/{org_id}/webhooks", json=body)
+
+    async def list(self, org_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/webhooks")
+
+    async def get(self, org_id: str, webhook_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/webhooks/{webhook_id}")
+
+    async def update(self, org_id: str, webhook_id: str, **kwargs: Any) -> dict:
+        return await self._http.put(f"/api/organizations/{org_id}/webhooks/{webhook_id}", json=kwargs)
+
+    async def delete(self, org_id: str, webhook_id: str) -> dict:
+        return await self._http.delete(f"/api/organizations/{org_id}/webhooks/{webhook_id}")
+
+    async def rotate_secret(self, org_id: str, webhook_id: str) -> dict:
+        return await self._http.post_empty(f"/api/organizations/{org_id}/webhooks/{webhook_id}/rotate-secret")
+
+    async def test(self, org_id: str, webhook_id: str, event_type: Optional[str] = None) -> dict:
+        body: dict[str, Any] = {}
+        if event_type:
+            body["event_type"] = event_type
+        return await self._http.post(f"/api/organizations/{org_id}/webhooks/{webhook_id}/test", json=body or None)
+
+    async def list_deliveries(self, org_id: str, webhook_id: str, **params: Any) -> builtins.list[dict]:
+        return await self._http.get(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries", params=params or None)
+
+    def iter_deliveries(self, org_id: str, webhook_id: str, page_size: int = 100, **params: Any) -> AsyncIterator[dict]:
+        """Iterate over every delivery (newest first), fetching the next page while one is consumed."""
+        page_size = min(page_size, MAX_DELIVERY_PAGE_SIZE)
+
+        async def fetch(offset: int) -> Page:
+            page = await self.list_deliveries(org_id, webhook_id, limit=page_size, offset=offset, **params)
+            return page, offset + len(page) if len(page) >= page_size else None
+
+        return aiter_pages(fetch, 0)
+
+    async def stream_deliveries(
+        self, org_id: str, webhook_id: str, poll_interval: float = 2.0, page_size: int = 50
+    ) -> AsyncIterator[dict]:
+        """Async counterpart of :meth:`WebhooksService.stream_deliveries`."""
+        path = f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries:stream"
+        if "deliveries:stream" not in self._unsupported:
+            try:
+                async for delivery in self._http.stream_events(path):
+                    yield delivery
+                return
+            except NotFoundError as e:
+                if not route_missing(e):
+                    raise
+                self._unsupported.add("deliveries:stream")
+        page_size = min(page_size, MAX_DELIVERY_PAGE_SIZE)
+        cursor = _DeliveryCursor()
+        cursor.advance(await self.list_deliveries(org_id, webhook_id, limit=page_size))
+        while True:
+            await asyncio.sleep(poll_interval)
+            fresh: builtins.list[dict] = []
+            offset = 0
+            while True:
+                page = await self.list_deliveries(org_id, webhook_id, limit=page_size, offset=offset)
+                new, reached = cursor.unseen(page)
+                fresh += new
+                if reached or len(page) < page_size:
+                    break
+                offset += len(page)
+            for delivery in reversed(cursor.advance(fresh)):
+                yield delivery
+
+    async def get_delivery(self, org_id: str, webhook_id: str, delivery_id: str) -> dict:
+        return await self._http.get(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries/{delivery_id}")
+
+    async def retry_delivery(self, org_id: str, webhook_id: str, delivery_id: str) -> dict:
+        return await self._http.post_empty(f"/api/organizations/{org_id}/webhooks/{webhook_id}/deliveries/{delivery_id}/retry")
+
+    async def list_event_types(self) -> dict:
+        return await self._http.get("/api/webhooks/event-types")
@@ -1,14 +1,236 @@
+"""Request and response models, imported lazily on first attribute access.
+
+Each submodule builds its pydantic classes when imported, so ``coreauth.types``
+only loads the modules whose models a program actually touches.
+"""
+
 from __future__ import annotations
 
-from .auth import *
-from .oauth2 import *
-from .mfa import *
-from .tenants import *
-from .applications import *
-from .fga import *
-from .audit import *
-from .webhooks import *
-from .groups import *
-from .scim import *
-from .admin import *
-from .connections import *
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._base import LazyRows, parse_list
+    from .admin import (
+        Action,
+        ActionExecution,
+        ActionTestResponse,
+        ConfigureDedicatedDbRequest,
+        ConnectionTestResult,
+        CreateActionRequest,
+        CreateRegistryTenantRequest,
+        HealthResponse,
+        RateLimitConfig,
+        TenantRegistryResponse,
+        TenantRouterStats,
+        TokenClaimsConfig,
+        UpdateActionRequest,
+        UpdateRateLimitRequest,
+        UpdateTokenClaimsRequest,
+    )
+    from .applications import (
+        Application,
+        ApplicationWithSecret,
+        AuthenticateAppRequest,
+        CreateApplicationRequest,
+        CreateOAuthAppRequest,
+        EmailTemplate,
+        UpdateApplicationRequest,
+        UpdateEmailTemplateRequest,
+    )
+    from .audit import AuditLog, AuditLogQuery, AuditLogsResponse, AuditStats
+    from .auth import (
+        AuthResponse,
+        ChangePasswordRequest,
+        FlowResponse,
+        HierarchicalLoginRequest,
+        LoginRequest,
+        PasswordlessStartRequest,
+        PasswordlessStartResponse,
+        PasswordlessVerifyRequest,
+        PasswordlessVerifyResponse,
+        RefreshTokenRequest,
+        RegisterRequest,
+        SessionResponse,
+        UpdateProfileRequest,
+        UserProfile,
+    )
+    from .connections import AuthMethod, Connection, CreateConnectionRequest, UpdateConnectionRequest
+    from .fga import (
+        AuthorizationModel,
+        CheckRequest,
+        CheckResponse,
+        CreateApiKeyRequest,
+        CreateStoreRequest,
+        CreateTupleRequest,
+        ExpandResponse,
+        FgaStore,
+        FgaStoreApiKey,
+        FgaStoreApiKeyWithSecret,
+        ForwardAuthRequest,
+        QueryTuplesRequest,
+        RelationTuple,
+        UpdateStoreRequest,
+        WriteModelRequest,
+        WriteTuplesRequest,
+    )
+    from .groups import (
+        AcceptInvitationRequest,
+        AddGroupMemberRequest,
+        AssignGroupRoleRequest,
+        CreateGroupRequest,
+        CreateInvitationRequest,
+        Group,
+        GroupMember,
+        GroupRole,
+        InvitationResponse,
+        UpdateGroupMemberRequest,
+        UpdateGroupRequest,
+    )
+    from .mfa import (
+        EnrollSmsRequest,
+        EnrollWithTokenRequest,
+        MfaEnrollResponse,
+        MfaMethod,
+        SmsMfaEnrollResponse,
+        VerifyMfaRequest,
+        VerifyWithTokenRequest,
+    )
+    from .oauth2 import (
+        IntrospectionRequest,
+        IntrospectionResponse,
+        Jwk,
+        Jwks,
+        OidcDiscovery,
+        RevocationRequest,
+        TokenRequest,
+        TokenResponse,
+        UserInfoResponse,
+    )
+    from .scim import (
+        GROUP_SCHEMAS,
+        PATCH_OP_SCHEMAS,
+        USER_SCHEMAS,
+        CreateOidcProviderRequest,
+        CreateScimGroupRequest,
+        CreateScimTokenRequest,
+        CreateScimUserRequest,
+        OidcLoginResponse,
+        OidcProvider,
+        ScimEmail,
+        ScimGroup,
+        ScimGroupRef,
+        ScimListResponse,
+        ScimMember,
+        ScimPatchOp,
+        ScimPatchRequest,
+        ScimPhoneNumber,
+        ScimTokenResponse,
+        ScimTokenWithSecret,
+        ScimUser,
+        SessionInfo,
+        SsoCheckResponse,
+        SsoProvider,
+        UpdateOidcProviderRequest,
+    )
+    from .tenants import (
+        BrandingSettings,
+        CreateTenantRequest,
+        CreateTenantResponse,
+        SecuritySettings,
+        UpdateBrandingRequest,
+        UpdateSecuritySettingsRequest,
+        UpdateUserRoleRequest,
+    )
+    from .webhooks import (
+        CreateWebhookRequest,
+        DeliveryQuery,
+        RetryPolicy,
+        TestWebhookRequest,
+        TestWebhookResponse,
+        UpdateWebhookRequest,
+        WebhookDelivery,
+        WebhookEventType,
+        WebhookResponse,
+        WebhookWithSecretResponse,
+    )
+
+# Submodule -> public names it defines.
+_EXPORTS = {
+    "auth": (
+        "RegisterRequest", "LoginRequest", "HierarchicalLoginRequest", "RefreshTokenRequest", "AuthResponse",
+        "UserProfile", "UpdateProfileRequest", "ChangePasswordRequest", "PasswordlessStartRequest",
+        "PasswordlessStartResponse", "PasswordlessVerifyRequest", "PasswordlessVerifyResponse", "FlowResponse",
+        "SessionResponse",
+    ),
+    "oauth2": (
+        "TokenRequest", "TokenResponse", "UserInfoResponse", "IntrospectionRequest", "IntrospectionResponse",
+        "RevocationRequest", "OidcDiscovery", "Jwk", "Jwks",
+    ),
+    "mfa": (
+        "MfaEnrollResponse", "SmsMfaEnrollResponse", "VerifyMfaRequest", "EnrollSmsRequest",
+        "EnrollWithTokenRequest", "VerifyWithTokenRequest", "MfaMethod",
+    ),
+    "tenants": (
+        "CreateTenantRequest", "CreateTenantResponse", "SecuritySettings", "UpdateSecuritySettingsRequest",
+        "BrandingSettings", "UpdateBrandingRequest", "UpdateUserRoleRequest",
+    ),
+    "applications": (
+        "CreateApplicationRequest", "Application", "ApplicationWithSecret", "CreateOAuthAppRequest",
+        "UpdateApplicationRequest", "EmailTemplate", "UpdateEmailTemplateRequest", "AuthenticateAppRequest",
+    ),
+    "fga": (
+        "CreateTupleRequest", "QueryTuplesRequest", "RelationTuple", "CheckRequest", "CheckResponse",
+        "ExpandResponse", "ForwardAuthRequest", "CreateStoreRequest", "FgaStore", "UpdateStoreRequest",
+        "WriteModelRequest", "AuthorizationModel", "CreateApiKeyRequest", "FgaStoreApiKey",
+        "FgaStoreApiKeyWithSecret", "WriteTuplesRequest",
+    ),
+    "audit": (
+        "AuditLogQuery", "AuditLog", "AuditLogsResponse", "AuditStats",
+    ),
+    "webhooks": (
+        "RetryPolicy", "CreateWebhookRequest", "UpdateWebhookRequest", "WebhookResponse",
+        "WebhookWithSecretResponse", "TestWebhookRequest", "TestWebhookResponse", "WebhookDelivery",
+        "DeliveryQuery", "WebhookEventType",
+    ),
+    "groups": (
+        "CreateGroupRequest", "Group", "UpdateGroupRequest", "AddGroupMemberRequest", "GroupMember",
+        "UpdateGroupMemberRequest", "GroupRole", "AssignGroupRoleRequest", "CreateInvitationRequest",
+        "InvitationResponse", "AcceptInvitationRequest",
+    ),
+    "scim": (
+        "ScimEmail", "ScimPhoneNumber", "ScimGroupRef", "ScimMember", "ScimPatchOp", "SsoProvider", "ScimUser",
+        "CreateScimUserRequest", "ScimGroup", "CreateScimGroupRequest", "ScimPatchRequest", "ScimListResponse",
+        "ScimTokenResponse", "ScimTokenWithSecret", "CreateScimTokenRequest", "SessionInfo", "OidcProvider",
+        "CreateOidcProviderRequest", "UpdateOidcProviderRequest", "OidcLoginResponse", "SsoCheckResponse",
+        "USER_SCHEMAS", "GROUP_SCHEMAS", "PATCH_OP_SCHEMAS",
+    ),
+    "admin": (
+        "TenantRegistryResponse", "CreateRegistryTenantRequest", "ConfigureDedicatedDbRequest", "TenantRouterStats",
+        "Action", "CreateActionRequest", "UpdateActionRequest", "ActionExecution", "ActionTestResponse",
+        "RateLimitConfig", "UpdateRateLimitRequest", "TokenClaimsConfig", "UpdateTokenClaimsRequest",
+        "ConnectionTestResult", "HealthResponse",
+    ),
+    "connections": (
+        "Connection", "CreateConnectionRequest", "UpdateConnectionRequest", "AuthMethod",
+    ),
+    "_base": ("LazyRows", "parse_list"),
+}
+
+_MODULES = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _MODULES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,174 @@
+"""Base classes shared by the SDK's pydantic models."""
+
+from __future__ import annotations
+
+import sys
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any, Generic, TypeVar, get_args, overload
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, GetCoreSchemaHandler, PlainSerializer, TypeAdapter
+from pydantic_core import core_schema
+from typing_extensions import Annotated
+
+from .._json import loads
+
+M = TypeVar("M", bound=BaseModel)
+
+# Enum-like string fields on row models (status, event_type, relation, ...)
+# take a handful of distinct values; interning them lets thousands of rows
+# share one str object per value instead of one per row.
+_Interned = Annotated[str, AfterValidator(sys.intern)]
+
+# Permission, scope and event lists on responses are used for membership
+# tests ("write" in key.permissions), so they are decoded to frozensets.
+# Serialization writes a sorted list, keeping output deterministic.
+_StrSet = Annotated[frozenset[str], PlainSerializer(sorted, return_type=list[str])]
+
+# Shared __pydantic_fields_set__ per distinct set of fields; see _Row.
+_FIELD_SETS: dict[frozenset[str], set[str]] = {}
+
+
+class _Request(BaseModel):
+    """Base for request bodies built by callers.
+
+    Validators are compiled on first instantiation rather than at import, so
+    only the models a program actually uses pay for schema construction.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+    def to_json(self) -> bytes:
+        """Serialize as a request body, leaving out fields that are ``None``.
+
+        Update requests typically set one or two of many optional fields; the
+        server treats an absent key as "unchanged", so unset fields are not sent.
+        Fields with a serialization alias (the SCIM models' camelCase keys) are
+        written under the alias. Goes straight to pydantic-core's serializer,
+        skipping ``model_dump_json``'s Python-level argument handling.
+        """
+        return self.__pydantic_serializer__.to_json(self, exclude_none=True, by_alias=True)
+
+
+class _Response(BaseModel):
+    """Base for models parsed from API responses.
+
+    Responses are read-only snapshots, so instances are frozen; fields the SDK
+    does not know about yet are dropped instead of failing validation. Array
+    fields on models that arrive many to a list response (e.g. ``Application``)
+    or are cached for long periods (``OidcDiscovery``, ``Jwks``) are typed as
+    tuples: they match the frozen instance, take less memory than lists, and
+    keep the instance hashable. As with :class:`_Request`, schema
+    construction is deferred to first use.
+    """
+
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=True)
+
+
+class _Row(_Response):
+    """Base for entity models (anything with an ``id``) that arrive many per list response.
+
+    Single-shot responses such as ``CheckResponse`` or ``TokenResponse`` sit on
+    the request-critical path and stay on :class:`_Response`, which has no
+    post-init hook; rows trade a little validation time for memory.
+    """
+
+    def model_post_init(self, context: Any) -> None:
+        # Pydantic models cannot declare per-field __slots__, and after the field
+        # dict the next largest per-instance cost is __pydantic_fields_set__
+        # (~700 B for a typical row). Rows of the same shape set the same fields,
+        # so frozen instances share one set per shape. pydantic's own
+        # model_copy() copies the set before updating it.
+        fields_set = self.__pydantic_fields_set__
+        object.__setattr__(
+            self, "__pydantic_fields_set__", _FIELD_SETS.setdefault(frozenset(fields_set), fields_set)
+        )
+
+
+class LazyRows(Sequence[M], Generic[M]):
+    """Read-only sequence of ``M`` that validates each row on first access.
+
+    Used for the row arrays of paged responses (``AuditLogsResponse.logs``):
+    the container keeps the decoded JSON rows and only builds a model for the
+    rows a caller actually reads, so filtering a page on one or two fields
+    costs O(rows touched) model validations instead of O(page size).
+    Serializing validates every row and dumps it through ``M``'s serializer.
+    """
+
+    __slots__ = ("_model", "_raw", "_rows")
+
+    def __init__(self, model: type[M], raw: list[Any]) -> None:
+        self._model = model
+        self._raw = raw
+        self._rows: list[Any] = [None] * len(raw)
+
+    @overload
+    def __getitem__(self, index: int) -> M: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[M]: ...
+
+    def __getitem__(self, index: Any) -> Any:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._raw)))]
+        row = self._rows[index]
+        if row is None:
+            row = self._rows[index] = self._model.model_validate(self._raw[index])
+        return row
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, LazyRows):
+            return self._raw == other._raw
+        if isinstance(other, Sequence):
+            return list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"LazyRows[{self._model.__name__}]({len(self._raw)} rows)"
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, source: Any, handler: GetCoreSchemaHandler) -> core_schema.CoreSchema:
+        (model,) = get_args(source)
+        # Validation only checks for a list; the JSON schema and the serializer
+        # still describe the rows as ``list[M]``.
+        rows_schema = core_schema.list_schema(handler.generate_schema(model))
+
+        def validate(raw: Any) -> LazyRows[Any]:
+            if not isinstance(raw, list):
+                raise ValueError("expected a list of rows")
+            return cls(model, raw)
+
+        return core_schema.no_info_plain_validator_function(
+            validate,
+            json_schema_input_schema=rows_schema,
+            serialization=core_schema.plain_serializer_function_ser_schema(list, return_schema=rows_schema),
+        )
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[Any]:
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
+
+
+def parse_list(model: type[M], data: Any) -> list[M]:
+    """Validate a list response (e.g. from ``fga.list_stores()``) into ``model`` instances.
+
+    The whole array is validated by one pydantic-core call through a cached
+    ``TypeAdapter`` instead of one ``model(**item)`` call per element. A
+    ``{"data": [...]}`` envelope is unwrapped. Raw ``bytes``/``str`` bodies holding
+    a JSON array are decoded straight into models by pydantic-core's parser,
+    without building intermediate dicts.
+    """
+    adapter = _list_adapter(model)
+    if isinstance(data, (bytes, str)):
+        if data.lstrip()[:1] in (b"[", "["):
+            return adapter.validate_json(data)
+        data = loads(data)
+    if isinstance(data, dict):
+        data = data.get("data", [])
+    return adapter.validate_python(data)
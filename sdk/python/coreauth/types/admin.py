@@ -1,55 +1,56 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from ._base import _Interned, _Request, _Response, _Row
 
 
-class TenantRegistryResponse(BaseModel):
+class TenantRegistryResponse(_Row):
     id: Optional[str] = None
     slug: Optional[str] = None
     name: Optional[str] = None
-    status: Optional[str] = None
-    isolation_mode: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    status: Optional[_Interned] = None
+    isolation_mode: Optional[_Interned] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class CreateRegistryTenantRequest(BaseModel):
+class CreateRegistryTenantRequest(_Request):
     slug: str
     name: str
     isolation_mode: Optional[str] = None
 
 
-class ConfigureDedicatedDbRequest(BaseModel):
+class ConfigureDedicatedDbRequest(_Request):
     connection_string: str
 
 
-class TenantRouterStats(BaseModel):
+class TenantRouterStats(_Response):
     total_tenants: int
     active_tenants: int
     shared_tenants: int
     dedicated_tenants: int
 
 
-class Action(BaseModel):
+class Action(_Row):
     id: Optional[str] = None
     organization_id: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
-    trigger_type: Optional[str] = None
+    trigger_type: Optional[_Interned] = None
     code: Optional[str] = None
-    runtime: Optional[str] = None
+    runtime: Optional[_Interned] = None
     timeout_seconds: Optional[int] = None
     is_enabled: Optional[bool] = None
     total_executions: Optional[int] = None
     total_failures: Optional[int] = None
-    last_executed_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    last_executed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class CreateActionRequest(BaseModel):
+class CreateActionRequest(_Request):
     name: str
     description: Optional[str] = None
     trigger_type: str
@@ -60,7 +61,7 @@ class CreateActionRequest(BaseModel):
     execution_order: Optional[int] = None
 
 
-class UpdateActionRequest(BaseModel):
+class UpdateActionRequest(_Request):
     name: Optional[str] = None
     description: Optional[str] = None
     code: Optional[str] = None
@@ -71,48 +72,48 @@ class UpdateActionRequest(BaseModel):
     is_enabled: Optional[bool] = None
 
 
-class ActionExecution(BaseModel):
+class ActionExecution(_Row):
     id: Optional[str] = None
     action_id: Optional[str] = None
     organization_id: Optional[str] = None
-    trigger_type: Optional[str] = None
+    trigger_type: Optional[_Interned] = None
     user_id: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[_Interned] = None
     execution_time_ms: Optional[int] = None
     input_data: Optional[dict[str, Any]] = None
     output_data: Optional[dict[str, Any]] = None
     error_message: Optional[str] = None
-    executed_at: Optional[str] = None
+    executed_at: Optional[datetime] = None
 
 
-class ActionTestResponse(BaseModel):
+class ActionTestResponse(_Response):
     success: bool
     data: Optional[dict[str, Any]] = None
     error: Optional[str] = None
 
 
-class RateLimitConfig(BaseModel):
+class RateLimitConfig(_Response):
     data: Optional[dict[str, Any]] = None
 
 
-class UpdateRateLimitRequest(BaseModel):
+class UpdateRateLimitRequest(_Request):
     data: Optional[dict[str, Any]] = None
 
 
-class TokenClaimsConfig(BaseModel):
+class TokenClaimsConfig(_Response):
     data: Optional[dict[str, Any]] = None
 
 
-class UpdateTokenClaimsRequest(BaseModel):
+class UpdateTokenClaimsRequest(_Request):
     data: Optional[dict[str, Any]] = None
 
 
-class ConnectionTestResult(BaseModel):
+class ConnectionTestResult(_Response):
     success: bool
     message: str
     latency_ms: Optional[int] = None
 
 
-class HealthResponse(BaseModel):
+class HealthResponse(_Response):
     status: str
     version: Optional[str] = None
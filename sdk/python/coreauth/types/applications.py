@@ -1,21 +1,24 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from ._base import _Interned, _Request, _Response, _Row, _StrSet
 
-class CreateApplicationRequest(BaseModel):
+
+class CreateApplicationRequest(_Request):
     tenant_id: str
     name: str
     description: Optional[str] = None
     application_type: Optional[str] = None
-    redirect_uris: list[str] = []
-    allowed_scopes: list[str] = []
+    redirect_uris: list[str] = Field(default_factory=list)
+    allowed_scopes: list[str] = Field(default_factory=list)
     metadata: Optional[dict[str, Any]] = None
 
 
-class Application(BaseModel):
+class Application(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
     organization_id: Optional[str] = None
@@ -23,54 +26,33 @@ class Application(BaseModel):
     slug: Optional[str] = None
     description: Optional[str] = None
     logo_url: Optional[str] = None
-    app_type: Optional[str] = None
+    app_type: Optional[_Interned] = None
     client_id: Optional[str] = None
-    callback_urls: Optional[list[str]] = None
-    logout_urls: Optional[list[str]] = None
-    web_origins: Optional[list[str]] = None
-    grant_types: Optional[list[str]] = None
-    response_types: Optional[list[str]] = None
-    allowed_scopes: Optional[list[str]] = None
+    callback_urls: Optional[tuple[str, ...]] = None
+    logout_urls: Optional[tuple[str, ...]] = None
+    web_origins: Optional[tuple[str, ...]] = None
+    grant_types: Optional[tuple[str, ...]] = None
+    response_types: Optional[tuple[str, ...]] = None
+    allowed_scopes: Optional[_StrSet] = None
     is_enabled: Optional[bool] = None
     is_first_party: Optional[bool] = None
     access_token_lifetime_seconds: Optional[int] = None
     refresh_token_lifetime_seconds: Optional[int] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class ApplicationWithSecret(BaseModel):
-    id: Optional[str] = None
-    tenant_id: Optional[str] = None
-    organization_id: Optional[str] = None
-    name: Optional[str] = None
-    slug: Optional[str] = None
-    description: Optional[str] = None
-    logo_url: Optional[str] = None
-    app_type: Optional[str] = None
-    client_id: Optional[str] = None
-    callback_urls: Optional[list[str]] = None
-    logout_urls: Optional[list[str]] = None
-    web_origins: Optional[list[str]] = None
-    grant_types: Optional[list[str]] = None
-    response_types: Optional[list[str]] = None
-    allowed_scopes: Optional[list[str]] = None
-    is_enabled: Optional[bool] = None
-    is_first_party: Optional[bool] = None
-    access_token_lifetime_seconds: Optional[int] = None
-    refresh_token_lifetime_seconds: Optional[int] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+class ApplicationWithSecret(Application):
     client_secret_plain: Optional[str] = None
 
 
-class CreateOAuthAppRequest(BaseModel):
+class CreateOAuthAppRequest(_Request):
     name: str
     slug: Optional[str] = None
     description: Optional[str] = None
     logo_url: Optional[str] = None
     app_type: Optional[str] = None
-    callback_urls: list[str] = []
+    callback_urls: list[str] = Field(default_factory=list)
     logout_urls: Optional[list[str]] = None
     web_origins: Optional[list[str]] = None
     access_token_lifetime_seconds: Optional[int] = None
@@ -80,7 +62,7 @@ class CreateOAuthAppRequest(BaseModel):
     organization_id: Optional[str] = None
 
 
-class UpdateApplicationRequest(BaseModel):
+class UpdateApplicationRequest(_Request):
     name: Optional[str] = None
     description: Optional[str] = None
     redirect_uris: Optional[list[str]] = None
@@ -89,23 +71,23 @@ class UpdateApplicationRequest(BaseModel):
     metadata: Optional[dict[str, Any]] = None
 
 
-class EmailTemplate(BaseModel):
+class EmailTemplate(_Response):
     template_type: Optional[str] = None
     subject: Optional[str] = None
     html_body: Optional[str] = None
     text_body: Optional[str] = None
-    variables: Optional[list[str]] = None
+    variables: Optional[tuple[str, ...]] = None
     is_custom: Optional[bool] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class UpdateEmailTemplateRequest(BaseModel):
+class UpdateEmailTemplateRequest(_Request):
     subject: Optional[str] = None
     html_body: Optional[str] = None
     text_body: Optional[str] = None
 
 
-class AuthenticateAppRequest(BaseModel):
+class AuthenticateAppRequest(_Request):
     client_id: str
     client_secret: str
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from ._base import LazyRows, _Interned, _Request, _Response, _Row
 
-class AuditLogQuery(BaseModel):
+
+class AuditLogQuery(_Request):
     tenant_id: Optional[str] = None
     event_types: Optional[list[str]] = None
     event_categories: Optional[list[str]] = None
@@ -18,35 +21,35 @@ class AuditLogQuery(BaseModel):
     offset: Optional[int] = None
 
 
-class AuditLog(BaseModel):
+class AuditLog(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
-    event_type: Optional[str] = None
-    event_category: Optional[str] = None
-    event_action: Optional[str] = None
-    actor_type: Optional[str] = None
+    event_type: Optional[_Interned] = None
+    event_category: Optional[_Interned] = None
+    event_action: Optional[_Interned] = None
+    actor_type: Optional[_Interned] = None
     actor_id: Optional[str] = None
     actor_name: Optional[str] = None
     actor_ip_address: Optional[str] = None
     actor_user_agent: Optional[str] = None
-    target_type: Optional[str] = None
+    target_type: Optional[_Interned] = None
     target_id: Optional[str] = None
     target_name: Optional[str] = None
     description: Optional[str] = None
     metadata: Optional[dict[str, Any]] = None
-    status: Optional[str] = None
+    status: Optional[_Interned] = None
     error_message: Optional[str] = None
     request_id: Optional[str] = None
     session_id: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 
-class AuditLogsResponse(BaseModel):
-    logs: list[AuditLog] = []
+class AuditLogsResponse(_Response):
+    logs: LazyRows[AuditLog] = Field(default_factory=list, validate_default=True)
     total: int
     limit: int
     offset: int
 
 
-class AuditStats(BaseModel):
+class AuditStats(_Response):
     data: Optional[dict[str, Any]] = None
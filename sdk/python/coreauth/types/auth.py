@@ -1,34 +1,35 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from ._base import _Interned, _Request, _Response, _Row
 
 
-class RegisterRequest(BaseModel):
+class RegisterRequest(_Request):
     tenant_id: str
     email: str
     password: str
     phone: Optional[str] = None
 
 
-class LoginRequest(BaseModel):
+class LoginRequest(_Request):
     tenant_id: str
     email: str
     password: str
 
 
-class HierarchicalLoginRequest(BaseModel):
+class HierarchicalLoginRequest(_Request):
     email: str
     password: str
     organization_slug: Optional[str] = None
 
 
-class RefreshTokenRequest(BaseModel):
+class RefreshTokenRequest(_Request):
     refresh_token: str
 
 
-class AuthResponse(BaseModel):
+class AuthResponse(_Response):
     access_token: str
     refresh_token: str
     token_type: str
@@ -38,7 +39,7 @@ class AuthResponse(BaseModel):
     mfa_token: Optional[str] = None
 
 
-class UserProfile(BaseModel):
+class UserProfile(_Row):
     id: str
     email: str
     email_verified: Optional[str] = None
@@ -47,11 +48,11 @@ class UserProfile(BaseModel):
     metadata: Optional[str] = None
     is_active: Optional[str] = None
     mfa_enabled: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class UpdateProfileRequest(BaseModel):
+class UpdateProfileRequest(_Request):
     first_name: Optional[str] = None
     last_name: Optional[str] = None
     full_name: Optional[str] = None
@@ -61,26 +62,26 @@ class UpdateProfileRequest(BaseModel):
     timezone: Optional[str] = None
 
 
-class ChangePasswordRequest(BaseModel):
+class ChangePasswordRequest(_Request):
     current_password: str
     new_password: str
 
 
-class PasswordlessStartRequest(BaseModel):
+class PasswordlessStartRequest(_Request):
     method: str
     email: str
 
 
-class PasswordlessStartResponse(BaseModel):
+class PasswordlessStartResponse(_Response):
     message: str
     expires_in: Optional[int] = None
 
 
-class PasswordlessVerifyRequest(BaseModel):
+class PasswordlessVerifyRequest(_Request):
     token_or_code: str
 
 
-class PasswordlessVerifyResponse(BaseModel):
+class PasswordlessVerifyResponse(_Response):
     access_token: Optional[str] = None
     refresh_token: Optional[str] = None
     token_type: Optional[str] = None
@@ -90,19 +91,19 @@ class PasswordlessVerifyResponse(BaseModel):
     mfa_token: Optional[str] = None
 
 
-class FlowResponse(BaseModel):
+class FlowResponse(_Row):
     id: str
-    type: Optional[str] = None
-    status: Optional[str] = None
+    type: Optional[_Interned] = None
+    status: Optional[_Interned] = None
     ui: Optional[dict[str, Any]] = None
-    created_at: Optional[str] = None
-    expires_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
     request_url: Optional[str] = None
 
 
-class SessionResponse(BaseModel):
+class SessionResponse(_Row):
     id: str
     active: bool
     identity: Optional[dict[str, Any]] = None
-    authenticated_at: Optional[str] = None
-    expires_at: Optional[str] = None
+    authenticated_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
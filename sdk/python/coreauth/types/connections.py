@@ -2,36 +2,37 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from ._base import _Interned, _Request, _Response, _Row
 
 
-class Connection(BaseModel):
+class Connection(_Row):
     id: str
     name: str
-    connection_type: str
-    scope: str
+    connection_type: _Interned
+    scope: _Interned
     organization_id: Optional[str] = None
     config: Any = None
     is_enabled: bool = True
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class CreateConnectionRequest(BaseModel):
+class CreateConnectionRequest(_Request):
     name: str
     connection_type: str
     config: Any = None
 
 
-class UpdateConnectionRequest(BaseModel):
+class UpdateConnectionRequest(_Request):
     name: Optional[str] = None
     config: Any = None
     is_enabled: Optional[bool] = None
 
 
-class AuthMethod(BaseModel):
+class AuthMethod(_Response):
     connection_id: str
     name: str
     method_type: str
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
 
+from ._base import _Interned, _Request, _Response, _Row, _StrSet
 
-class CreateTupleRequest(BaseModel):
+
+class CreateTupleRequest(_Request):
     tenant_id: str
     namespace: str
     object_id: str
@@ -15,7 +18,7 @@ class CreateTupleRequest(BaseModel):
     subject_relation: Optional[str] = None
 
 
-class QueryTuplesRequest(BaseModel):
+class QueryTuplesRequest(_Request):
     tenant_id: str
     namespace: Optional[str] = None
     object_id: Optional[str] = None
@@ -24,19 +27,19 @@ class QueryTuplesRequest(BaseModel):
     subject_id: Optional[str] = None
 
 
-class RelationTuple(BaseModel):
+class RelationTuple(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
-    namespace: Optional[str] = None
+    namespace: Optional[_Interned] = None
     object_id: Optional[str] = None
-    relation: Optional[str] = None
-    subject_type: Optional[str] = None
+    relation: Optional[_Interned] = None
+    subject_type: Optional[_Interned] = None
     subject_id: Optional[str] = None
-    subject_relation: Optional[str] = None
-    created_at: Optional[str] = None
+    subject_relation: Optional[_Interned] = None
+    created_at: Optional[datetime] = None
 
 
-class CheckRequest(BaseModel):
+class CheckRequest(_Request):
     tenant_id: str
     subject_type: str
     subject_id: str
@@ -46,16 +49,16 @@ class CheckRequest(BaseModel):
     context: Optional[dict[str, Any]] = None
 
 
-class CheckResponse(BaseModel):
+class CheckResponse(_Response):
     allowed: bool
     reason: Optional[str] = None
 
 
-class ExpandResponse(BaseModel):
+class ExpandResponse(_Response):
     tree: dict[str, Any]
 
 
-class ForwardAuthRequest(BaseModel):
+class ForwardAuthRequest(_Request):
     tenant_id: str
     subject_type: str
     subject_id: str
@@ -64,12 +67,12 @@ class ForwardAuthRequest(BaseModel):
     object_id: str
 
 
-class CreateStoreRequest(BaseModel):
+class CreateStoreRequest(_Request):
     name: str
     description: Optional[str] = None
 
 
-class FgaStore(BaseModel):
+class FgaStore(_Row):
     id: Optional[str] = None
     name: Optional[str] = None
     description: Optional[str] = None
@@ -77,21 +80,21 @@ class FgaStore(BaseModel):
     is_active: Optional[bool] = None
     tuple_count: Optional[int] = None
     settings: Optional[dict[str, Any]] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class UpdateStoreRequest(BaseModel):
+class UpdateStoreRequest(_Request):
     name: Optional[str] = None
     description: Optional[str] = None
     is_active: Optional[bool] = None
 
 
-class WriteModelRequest(BaseModel):
+class WriteModelRequest(_Request):
     schema: dict[str, Any]
 
 
-class AuthorizationModel(BaseModel):
+class AuthorizationModel(_Row):
     id: Optional[str] = None
     store_id: Optional[str] = None
     version: Optional[int] = None
@@ -100,45 +103,34 @@ class AuthorizationModel(BaseModel):
     is_valid: Optional[bool] = None
     validation_errors: Optional[list[str]] = None
     created_by: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 
-class CreateApiKeyRequest(BaseModel):
+class CreateApiKeyRequest(_Request):
     name: str
-    permissions: list[str] = []
+    permissions: list[str] = Field(default_factory=list)
     rate_limit_per_minute: Optional[int] = None
     expires_at: Optional[str] = None
 
 
-class FgaStoreApiKey(BaseModel):
+class FgaStoreApiKey(_Row):
     id: Optional[str] = None
     store_id: Optional[str] = None
     name: Optional[str] = None
     key_prefix: Optional[str] = None
-    permissions: Optional[list[str]] = None
+    permissions: Optional[_StrSet] = None
     rate_limit_per_minute: Optional[int] = None
     is_active: Optional[bool] = None
-    last_used_at: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    last_used_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class FgaStoreApiKeyWithSecret(BaseModel):
-    id: Optional[str] = None
-    store_id: Optional[str] = None
-    name: Optional[str] = None
-    key_prefix: Optional[str] = None
-    permissions: Optional[list[str]] = None
-    rate_limit_per_minute: Optional[int] = None
-    is_active: Optional[bool] = None
-    last_used_at: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+class FgaStoreApiKeyWithSecret(FgaStoreApiKey):
     key: str
 
 
-class WriteTuplesRequest(BaseModel):
-    writes: list[dict[str, Any]] = []
+class WriteTuplesRequest(_Request):
+    writes: list[dict[str, Any]] = Field(default_factory=list)
     deletes: Optional[list[dict[str, Any]]] = None
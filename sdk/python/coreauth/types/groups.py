@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from ._base import _Interned, _Request, _Response, _Row
 
 
-class CreateGroupRequest(BaseModel):
+class CreateGroupRequest(_Request):
     name: str
     description: Optional[str] = None
     external_id: Optional[str] = None
 
 
-class Group(BaseModel):
+class Group(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
     organization_id: Optional[str] = None
@@ -19,63 +20,63 @@ class Group(BaseModel):
     description: Optional[str] = None
     external_id: Optional[str] = None
     member_count: Optional[int] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class UpdateGroupRequest(BaseModel):
+class UpdateGroupRequest(_Request):
     name: Optional[str] = None
     description: Optional[str] = None
 
 
-class AddGroupMemberRequest(BaseModel):
+class AddGroupMemberRequest(_Request):
     user_id: str
     role: Optional[str] = None
 
 
-class GroupMember(BaseModel):
+class GroupMember(_Row):
     id: Optional[str] = None
     user_id: Optional[str] = None
     group_id: Optional[str] = None
-    role: Optional[str] = None
+    role: Optional[_Interned] = None
     email: Optional[str] = None
     full_name: Optional[str] = None
-    joined_at: Optional[str] = None
+    joined_at: Optional[datetime] = None
 
 
-class UpdateGroupMemberRequest(BaseModel):
+class UpdateGroupMemberRequest(_Request):
     role: str
 
 
-class GroupRole(BaseModel):
+class GroupRole(_Response):
     role_id: Optional[str] = None
     group_id: Optional[str] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
 
 
-class AssignGroupRoleRequest(BaseModel):
+class AssignGroupRoleRequest(_Request):
     role_id: str
 
 
-class CreateInvitationRequest(BaseModel):
+class CreateInvitationRequest(_Request):
     email: str
     role_id: Optional[str] = None
     metadata: Optional[dict[str, Any]] = None
     expires_in_days: Optional[int] = None
 
 
-class InvitationResponse(BaseModel):
+class InvitationResponse(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
     email: Optional[str] = None
     role_id: Optional[str] = None
-    status: Optional[str] = None
+    status: Optional[_Interned] = None
     invited_by: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
 
 
-class AcceptInvitationRequest(BaseModel):
+class AcceptInvitationRequest(_Request):
     token: str
     password: str
     full_name: str
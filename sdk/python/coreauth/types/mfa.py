@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Optional
 
-from pydantic import BaseModel
+from ._base import _Interned, _Request, _Response, _Row
 
 
-class MfaEnrollResponse(BaseModel):
+class MfaEnrollResponse(_Response):
     method_id: Optional[str] = None
     method_type: Optional[str] = None
     secret: Optional[str] = None
@@ -13,36 +14,36 @@ class MfaEnrollResponse(BaseModel):
     backup_codes: Optional[list[str]] = None
 
 
-class SmsMfaEnrollResponse(BaseModel):
+class SmsMfaEnrollResponse(_Response):
     method_id: Optional[str] = None
     method_type: Optional[str] = None
     phone_number: Optional[str] = None
     masked_phone: Optional[str] = None
-    expires_at: Optional[str] = None
+    expires_at: Optional[datetime] = None
 
 
-class VerifyMfaRequest(BaseModel):
+class VerifyMfaRequest(_Request):
     code: str
 
 
-class EnrollSmsRequest(BaseModel):
+class EnrollSmsRequest(_Request):
     phone_number: str
 
 
-class EnrollWithTokenRequest(BaseModel):
+class EnrollWithTokenRequest(_Request):
     enrollment_token: str
 
 
-class VerifyWithTokenRequest(BaseModel):
+class VerifyWithTokenRequest(_Request):
     enrollment_token: str
     code: str
 
 
-class MfaMethod(BaseModel):
+class MfaMethod(_Row):
     id: Optional[str] = None
     user_id: Optional[str] = None
-    method_type: Optional[str] = None
+    method_type: Optional[_Interned] = None
     verified: Optional[bool] = None
     name: Optional[str] = None
-    created_at: Optional[str] = None
-    last_used_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    last_used_at: Optional[datetime] = None
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Optional
+from datetime import datetime
+from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import ConfigDict, with_config
+from typing_extensions import NotRequired, TypedDict
 
+from ._base import _Request, _Response, _StrSet
 
-class TokenRequest(BaseModel):
+
+class TokenRequest(_Request):
     grant_type: str
     code: Optional[str] = None
     redirect_uri: Optional[str] = None
@@ -17,7 +21,7 @@ class TokenRequest(BaseModel):
     audience: Optional[str] = None
 
 
-class TokenResponse(BaseModel):
+class TokenResponse(_Response):
     access_token: Optional[str] = None
     token_type: Optional[str] = None
     expires_in: Optional[int] = None
@@ -26,7 +30,7 @@ class TokenResponse(BaseModel):
     scope: Optional[str] = None
 
 
-class UserInfoResponse(BaseModel):
+class UserInfoResponse(_Response):
     sub: Optional[str] = None
     name: Optional[str] = None
     given_name: Optional[str] = None
@@ -35,17 +39,17 @@ class UserInfoResponse(BaseModel):
     email_verified: Optional[bool] = None
     picture: Optional[str] = None
     locale: Optional[str] = None
-    updated_at: Optional[str] = None
+    updated_at: Optional[datetime] = None
     org_id: Optional[str] = None
     org_name: Optional[str] = None
 
 
-class IntrospectionRequest(BaseModel):
+class IntrospectionRequest(_Request):
     token: str
     token_type_hint: Optional[str] = None
 
 
-class IntrospectionResponse(BaseModel):
+class IntrospectionResponse(_Response):
     active: Optional[bool] = None
     scope: Optional[str] = None
     client_id: Optional[str] = None
@@ -59,31 +63,46 @@ class IntrospectionResponse(BaseModel):
     jti: Optional[str] = None
 
 
-class RevocationRequest(BaseModel):
+class RevocationRequest(_Request):
     token: str
     token_type_hint: Optional[str] = None
 
 
-class OidcDiscovery(BaseModel):
+class OidcDiscovery(_Response):
     issuer: str
     authorization_endpoint: str
     token_endpoint: str
     userinfo_endpoint: Optional[str] = None
     jwks_uri: str
     registration_endpoint: Optional[str] = None
-    scopes_supported: Optional[list[str]] = None
-    response_types_supported: Optional[list[str]] = None
-    response_modes_supported: Optional[list[str]] = None
-    grant_types_supported: Optional[list[str]] = None
-    subject_types_supported: Optional[list[str]] = None
-    id_token_signing_alg_values_supported: Optional[list[str]] = None
-    token_endpoint_auth_methods_supported: Optional[list[str]] = None
-    claims_supported: Optional[list[str]] = None
-    code_challenge_methods_supported: Optional[list[str]] = None
+    scopes_supported: Optional[_StrSet] = None
+    response_types_supported: Optional[tuple[str, ...]] = None
+    response_modes_supported: Optional[tuple[str, ...]] = None
+    grant_types_supported: Optional[tuple[str, ...]] = None
+    subject_types_supported: Optional[tuple[str, ...]] = None
+    id_token_signing_alg_values_supported: Optional[tuple[str, ...]] = None
+    token_endpoint_auth_methods_supported: Optional[tuple[str, ...]] = None
+    claims_supported: Optional[tuple[str, ...]] = None
+    code_challenge_methods_supported: Optional[tuple[str, ...]] = None
     introspection_endpoint: Optional[str] = None
     revocation_endpoint: Optional[str] = None
     end_session_endpoint: Optional[str] = None
 
 
-class Jwks(BaseModel):
-    keys: list[dict[str, Any]]
+@with_config(ConfigDict(extra="allow"))
+class Jwk(TypedDict):
+    """One JSON Web Key (RFC 7517); a plain dict at runtime, extra members kept."""
+
+    kty: str
+    kid: NotRequired[str]
+    use: NotRequired[str]
+    alg: NotRequired[str]
+    n: NotRequired[str]
+    e: NotRequired[str]
+    crv: NotRequired[str]
+    x: NotRequired[str]
+    y: NotRequired[str]
+
+
+class Jwks(_Response):
+    keys: tuple[Jwk, ...]
@@ -1,119 +1,164 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import ConfigDict, Field, with_config
+from typing_extensions import NotRequired, TypedDict
 
+from .._scim import GROUP_SCHEMAS, PATCH_OP_SCHEMAS, USER_SCHEMAS
+from ._base import _Interned, _Request, _Response, _Row, _StrSet
 
-class ScimUser(BaseModel):
+# Shapes of the SCIM sub-objects. They are TypedDicts, so values stay plain
+# dicts at runtime and unknown attributes are kept, while editors and
+# type checkers see the keys. The "$ref" key needs TypedDict's functional form.
+
+
+@with_config(ConfigDict(extra="allow"))
+class ScimEmail(TypedDict):
+    value: str
+    type: NotRequired[Optional[str]]
+    primary: NotRequired[bool]
+
+
+@with_config(ConfigDict(extra="allow"))
+class ScimPhoneNumber(TypedDict):
+    value: str
+    type: NotRequired[Optional[str]]
+    primary: NotRequired[bool]
+
+
+ScimGroupRef = TypedDict("ScimGroupRef", {"value": str, "$ref": NotRequired[str], "display": NotRequired[str]})
+ScimGroupRef.__pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[attr-defined]
+
+ScimMember = TypedDict("ScimMember", {"value": str, "$ref": NotRequired[str], "display": NotRequired[str]})
+ScimMember.__pydantic_config__ = ConfigDict(extra="allow")  # type: ignore[attr-defined]
+
+
+@with_config(ConfigDict(extra="allow"))
+class ScimPatchOp(TypedDict):
+    op: str
+    path: NotRequired[str]
+    value: NotRequired[Any]
+
+
+@with_config(ConfigDict(extra="allow"))
+class SsoProvider(TypedDict):
+    id: str
+    name: str
+    provider_type: str
+    tenant_id: str
+
+
+class ScimUser(_Row):
     schemas: Optional[list[str]] = None
     id: Optional[str] = None
     external_id: Optional[str] = None
     user_name: Optional[str] = None
     name: Optional[dict[str, str]] = None
     display_name: Optional[str] = None
-    emails: Optional[list[dict[str, Any]]] = None
-    phone_numbers: Optional[list[dict[str, Any]]] = None
+    emails: Optional[list[ScimEmail]] = None
+    phone_numbers: Optional[list[ScimPhoneNumber]] = None
     active: Optional[bool] = None
-    groups: Optional[list[dict[str, Any]]] = None
+    groups: Optional[list[ScimGroupRef]] = None
     meta: Optional[dict[str, Any]] = None
 
 
-class CreateScimUserRequest(BaseModel):
-    schemas: Optional[list[str]] = None
-    external_id: Optional[str] = None
-    user_name: str
+# SCIM bodies use camelCase keys (RFC 7643). The request models keep
+# snake_case attribute names and serialize under the SCIM name, so
+# ``to_json()`` produces a body the server accepts.
+
+
+class CreateScimUserRequest(_Request):
+    schemas: tuple[str, ...] = USER_SCHEMAS
+    external_id: Optional[str] = Field(default=None, serialization_alias="externalId")
+    user_name: str = Field(serialization_alias="userName")
     name: dict[str, str]
-    display_name: Optional[str] = None
-    emails: list[dict[str, Any]] = []
-    phone_numbers: Optional[list[dict[str, Any]]] = None
+    display_name: Optional[str] = Field(default=None, serialization_alias="displayName")
+    emails: list[ScimEmail] = Field(default_factory=list)
+    phone_numbers: Optional[list[ScimPhoneNumber]] = Field(default=None, serialization_alias="phoneNumbers")
     active: bool = True
     password: Optional[str] = None
 
 
-class ScimGroup(BaseModel):
+class ScimGroup(_Row):
     schemas: Optional[list[str]] = None
     id: Optional[str] = None
     external_id: Optional[str] = None
     display_name: Optional[str] = None
-    members: Optional[list[dict[str, Any]]] = None
+    members: Optional[list[ScimMember]] = None
     meta: Optional[dict[str, Any]] = None
 
 
-class CreateScimGroupRequest(BaseModel):
-    schemas: Optional[list[str]] = None
-    external_id: Optional[str] = None
-    display_name: str
-    members: Optional[list[dict[str, Any]]] = None
+class CreateScimGroupRequest(_Request):
+    schemas: tuple[str, ...] = GROUP_SCHEMAS
+    external_id: Optional[str] = Field(default=None, serialization_alias="externalId")
+    display_name: str = Field(serialization_alias="displayName")
+    members: Optional[list[ScimMember]] = None
 
 
-class ScimPatchRequest(BaseModel):
-    schemas: Optional[list[str]] = None
-    operations: list[dict[str, Any]] = []
+class ScimPatchRequest(_Request):
+    schemas: tuple[str, ...] = PATCH_OP_SCHEMAS
+    operations: list[ScimPatchOp] = Field(default_factory=list, serialization_alias="Operations")
 
 
-class ScimListResponse(BaseModel):
+class ScimListResponse(_Response):
     schemas: Optional[list[str]] = None
     total_results: int
     items_per_page: int
     start_index: int
-    resources: list[dict[str, Any]] = []
+    resources: list[dict[str, Any]] = Field(default_factory=list)
 
 
-class ScimTokenResponse(BaseModel):
+class ScimTokenResponse(_Row):
     id: Optional[str] = None
     name: Optional[str] = None
     token_prefix: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
 
 
-class ScimTokenWithSecret(BaseModel):
-    id: Optional[str] = None
-    name: Optional[str] = None
-    token_prefix: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
+class ScimTokenWithSecret(ScimTokenResponse):
     secret: Optional[str] = None
 
 
-class CreateScimTokenRequest(BaseModel):
+class CreateScimTokenRequest(_Request):
     name: str
     expires_at: Optional[str] = None
 
 
-class SessionInfo(BaseModel):
+class SessionInfo(_Row):
     id: Optional[str] = None
     user_id: Optional[str] = None
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
-    authenticated_at: Optional[str] = None
-    last_active_at: Optional[str] = None
-    expires_at: Optional[str] = None
-    created_at: Optional[str] = None
+    authenticated_at: Optional[datetime] = None
+    last_active_at: Optional[datetime] = None
+    expires_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
 
 
-class OidcProvider(BaseModel):
+class OidcProvider(_Row):
     id: Optional[str] = None
     tenant_id: Optional[str] = None
     name: Optional[str] = None
-    provider_type: Optional[str] = None
+    provider_type: Optional[_Interned] = None
     issuer: Optional[str] = None
     client_id: Optional[str] = None
     authorization_endpoint: Optional[str] = None
     token_endpoint: Optional[str] = None
     userinfo_endpoint: Optional[str] = None
     jwks_uri: Optional[str] = None
-    scopes: Optional[list[str]] = None
+    scopes: Optional[_StrSet] = None
     groups_claim: Optional[str] = None
     group_role_mappings: Optional[dict[str, str]] = None
     allowed_group_id: Optional[str] = None
     is_enabled: Optional[bool] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class CreateOidcProviderRequest(BaseModel):
+class CreateOidcProviderRequest(_Request):
     tenant_id: str
     name: str
     provider_type: str
@@ -130,18 +175,18 @@ class CreateOidcProviderRequest(BaseModel):
     allowed_group_id: Optional[str] = None
 
 
-class UpdateOidcProviderRequest(BaseModel):
+class UpdateOidcProviderRequest(_Request):
     is_enabled: Optional[bool] = None
     name: Optional[str] = None
     client_id: Optional[str] = None
     client_secret: Optional[str] = None
 
 
-class OidcLoginResponse(BaseModel):
+class OidcLoginResponse(_Response):
     authorization_url: str
     state: str
 
 
-class SsoCheckResponse(BaseModel):
+class SsoCheckResponse(_Response):
     has_sso: bool
-    providers: list[dict[str, Any]] = []
+    providers: list[SsoProvider] = Field(default_factory=list)
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel
+from ._base import _Request, _Response
 
 
-class CreateTenantRequest(BaseModel):
+class CreateTenantRequest(_Request):
     name: str
     slug: str
     admin_email: str
@@ -15,7 +15,7 @@ class CreateTenantRequest(BaseModel):
     isolation_mode: Optional[str] = None
 
 
-class CreateTenantResponse(BaseModel):
+class CreateTenantResponse(_Response):
     tenant_id: Optional[str] = None
     tenant_name: Optional[str] = None
     admin_user_id: Optional[str] = None
@@ -25,7 +25,7 @@ class CreateTenantResponse(BaseModel):
     database_setup_required: Optional[bool] = None
 
 
-class SecuritySettings(BaseModel):
+class SecuritySettings(_Response):
     mfa_required: Optional[bool] = None
     password_min_length: Optional[int] = None
     max_login_attempts: Optional[int] = None
@@ -39,7 +39,7 @@ class SecuritySettings(BaseModel):
     enforce_sso: Optional[bool] = None
 
 
-class UpdateSecuritySettingsRequest(BaseModel):
+class UpdateSecuritySettingsRequest(_Request):
     mfa_required: Optional[bool] = None
     password_min_length: Optional[int] = None
     max_login_attempts: Optional[int] = None
@@ -53,7 +53,7 @@ class UpdateSecuritySettingsRequest(BaseModel):
     enforce_sso: Optional[bool] = None
 
 
-class BrandingSettings(BaseModel):
+class BrandingSettings(_Response):
     logo_url: Optional[str] = None
     primary_color: Optional[str] = None
     favicon_url: Optional[str] = None
@@ -65,7 +65,7 @@ class BrandingSettings(BaseModel):
     support_url: Optional[str] = None
 
 
-class UpdateBrandingRequest(BaseModel):
+class UpdateBrandingRequest(_Request):
     logo_url: Optional[str] = None
     primary_color: Optional[str] = None
     favicon_url: Optional[str] = None
@@ -77,5 +77,5 @@ class UpdateBrandingRequest(BaseModel):
     support_url: Optional[str] = None
 
 
-class UpdateUserRoleRequest(BaseModel):
+class UpdateUserRoleRequest(_Request):
     role: str
@@ -1,68 +1,66 @@
 from __future__ import annotations
 
+from datetime import datetime
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import Field
+from typing_extensions import TypedDict
 
+from ._base import _Interned, _Request, _Response, _Row, _StrSet
 
-class CreateWebhookRequest(BaseModel):
+
+class RetryPolicy(TypedDict):
+    """Webhook retry policy, as the server's ``RetryPolicy`` (all keys required)."""
+
+    max_retries: int
+    initial_delay_ms: int
+    max_delay_ms: int
+
+
+class CreateWebhookRequest(_Request):
     name: str
     url: str
-    events: list[str] = []
+    events: list[str] = Field(default_factory=list)
     is_enabled: bool = False
-    retry_policy: Optional[dict[str, Any]] = None
+    retry_policy: Optional[RetryPolicy] = None
     custom_headers: Optional[dict[str, str]] = None
 
 
-class UpdateWebhookRequest(BaseModel):
+class UpdateWebhookRequest(_Request):
     name: Optional[str] = None
     url: Optional[str] = None
     events: Optional[list[str]] = None
     is_enabled: Optional[bool] = None
-    retry_policy: Optional[dict[str, Any]] = None
+    retry_policy: Optional[RetryPolicy] = None
     custom_headers: Optional[dict[str, str]] = None
 
 
-class WebhookResponse(BaseModel):
+class WebhookResponse(_Row):
     id: Optional[str] = None
     organization_id: Optional[str] = None
     name: Optional[str] = None
     url: Optional[str] = None
-    events: Optional[list[str]] = None
+    events: Optional[_StrSet] = None
     is_enabled: Optional[bool] = None
-    retry_policy: Optional[dict[str, Any]] = None
+    retry_policy: Optional[RetryPolicy] = None
     custom_headers: Optional[dict[str, str]] = None
     total_deliveries: Optional[int] = None
     successful_deliveries: Optional[int] = None
     failed_deliveries: Optional[int] = None
-    last_triggered_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+    last_triggered_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
 
 
-class WebhookWithSecretResponse(BaseModel):
-    id: Optional[str] = None
-    organization_id: Optional[str] = None
-    name: Optional[str] = None
-    url: Optional[str] = None
-    events: Optional[list[str]] = None
-    is_enabled: Optional[bool] = None
-    retry_policy: Optional[dict[str, Any]] = None
-    custom_headers: Optional[dict[str, str]] = None
-    total_deliveries: Optional[int] = None
-    successful_deliveries: Optional[int] = None
-    failed_deliveries: Optional[int] = None
-    last_triggered_at: Optional[str] = None
-    created_at: Optional[str] = None
-    updated_at: Optional[str] = None
+class WebhookWithSecretResponse(WebhookResponse):
     secret: Optional[str] = None
 
 
-class TestWebhookRequest(BaseModel):
+class TestWebhookRequest(_Request):
     event_type: Optional[str] = None
 
 
-class TestWebhookResponse(BaseModel):
+class TestWebhookResponse(_Response):
     success: bool
     status_code: Optional[int] = None
     response_time_ms: Optional[int] = None
@@ -70,34 +68,34 @@ class TestWebhookResponse(BaseModel):
     error: Optional[str] = None
 
 
-class WebhookDelivery(BaseModel):
+class WebhookDelivery(_Row):
     id: Optional[str] = None
     webhook_id: Optional[str] = None
     event_id: Optional[str] = None
-    event_type: Optional[str] = None
+    event_type: Optional[_Interned] = None
     payload: Optional[dict[str, Any]] = None
-    status: Optional[str] = None
+    status: Optional[_Interned] = None
     response_status: Optional[int] = None
     response_time_ms: Optional[int] = None
     attempt_count: Optional[int] = None
     max_attempts: Optional[int] = None
-    next_retry_at: Optional[str] = None
+    next_retry_at: Optional[datetime] = None
     last_error: Optional[str] = None
-    delivered_at: Optional[str] = None
-    failed_at: Optional[str] = None
-    created_at: Optional[str] = None
+    delivered_at: Optional[datetime] = None
+    failed_at: Optional[datetime] = None
+    created_at: Optional[datetime] = None
 
 
-class DeliveryQuery(BaseModel):
+class DeliveryQuery(_Request):
     event_type: Optional[str] = None
     status: Optional[str] = None
     limit: Optional[int] = None
     offset: Optional[int] = None
 
 
-class WebhookEventType(BaseModel):
+class WebhookEventType(_Row):
     id: Optional[str] = None
-    category: Optional[str] = None
+    category: Optional[_Interned] = None
     description: Optional[str] = None
     payload_schema: Optional[dict[str, Any]] = None
-    created_at: Optional[str] = None
+    created_at: Optional[datetime] = None
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import httpx
+import pytest
+
+from coreauth import AsyncCoreAuthClient, CoreAuthClient
+
+BASE_URL = "http://coreauth.test"
+
+Handler = Callable[[httpx.Request], Any]
+
+
+@pytest.fixture
+def make_client() -> Any:
+    """Build a ``CoreAuthClient`` whose requests are answered by ``handler``."""
+    clients: list[CoreAuthClient] = []
+
+    def make(handler: Handler, **kwargs: Any) -> CoreAuthClient:
+        client = CoreAuthClient(BASE_URL, **kwargs)
+        client._http._client.close()
+        client._http._client = httpx.Client(transport=httpx.MockTransport(handler))
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def make_async_client() -> Callable[..., AsyncCoreAuthClient]:
+    """Build an ``AsyncCoreAuthClient`` whose requests are answered by ``handler``.
+
+    Must be called inside the event loop that uses the client.
+    """
+
+    def make(handler: Handler, **kwargs: Any) -> AsyncCoreAuthClient:
+        client = AsyncCoreAuthClient(BASE_URL, **kwargs)
+        client._http._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+
+    return make
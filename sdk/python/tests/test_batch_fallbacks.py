@@ -0,0 +1,105 @@
+"""Batch endpoints fall back to individual calls when the server answers an empty 404."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from coreauth import NotFoundError
+
+
+def _router(calls, missing):
+    def handler(request):
+        calls.append((request.method, request.url.path))
+        if request.url.path.endswith(missing):
+            return httpx.Response(404)
+        return httpx.Response(200, json={"ok": 1, "allowed": True})
+
+    return handler
+
+
+def test_add_members_falls_back_and_remembers(make_client):
+    calls = []
+    client = make_client(_router(calls, "members:batch"))
+    assert len(client.groups.add_members("t", "g", [{"user_id": "a"}, {"user_id": "b"}])) == 2
+    client.groups.add_members("t", "g", [{"user_id": "c"}])
+    assert sum(path.endswith("members:batch") for _, path in calls) == 1
+    assert sum(path == "/api/tenants/t/groups/g/members" for _, path in calls) == 3
+
+
+def test_remove_members_falls_back(make_client):
+    calls = []
+    client = make_client(_router(calls, "members:batchDelete"))
+    assert len(client.groups.remove_members("t", "g", ["a", "b"])) == 2
+    client.groups.remove_members("t", "g", ["c"])
+    assert sum(path.endswith("members:batchDelete") for _, path in calls) == 1
+    assert ("DELETE", "/api/tenants/t/groups/g/members/b") in calls
+
+
+def test_write_tuples_batch_falls_back(make_client):
+    calls = []
+    client = make_client(_router(calls, "tuples:write"))
+    writes = [dict(namespace="doc", object_id=str(i), relation="viewer", subject_type="user", subject_id="u") for i in range(3)]
+    results = client.fga.write_tuples_batch("t", writes, [dict(namespace="doc", object_id="9")])
+    assert len(results) == 4
+    assert sum(method == "DELETE" for method, _ in calls) == 1
+
+
+def test_bulk_check_falls_back(make_client):
+    calls = []
+    client = make_client(_router(calls, "check/bulk"))
+    checks = [dict(subject_type="user", subject_id="u", relation="viewer", namespace="doc", object_id=str(i)) for i in range(3)]
+    assert [r["allowed"] for r in client.fga.bulk_check("t", checks)] == [True] * 3
+    assert sum(path == "/api/authz/check" for _, path in calls) == 3
+
+
+def test_stream_deliveries_falls_back_to_polling(make_client):
+    polls = iter([[{"id": "1"}], [{"id": "2"}, {"id": "1"}]])
+
+    def handler(request):
+        if request.url.path.endswith(":stream"):
+            return httpx.Response(404)
+        return httpx.Response(200, json=next(polls))
+
+    client = make_client(handler, cache_size=0)
+    stream = client.webhooks.stream_deliveries("org", "hook", poll_interval=0)
+    assert next(stream)["id"] == "2"
+    assert "deliveries:stream" in client.webhooks._unsupported
+
+
+def test_handler_404_is_not_treated_as_missing_route(make_client):
+    def handler(request):
+        return httpx.Response(404, json={"error": "not_found", "message": "group not found"})
+
+    client = make_client(handler)
+    with pytest.raises(NotFoundError):
+        client.groups.add_members("t", "g", [{"user_id": "a"}])
+    assert not client.groups._unsupported
+
+
+def test_async_add_members_falls_back(make_async_client):
+    calls = []
+
+    async def main():
+        client = make_async_client(_router(calls, "members:batch"))
+        results = await client.groups.add_members("t", "g", [{"user_id": "a"}] * 3)
+        await client.aclose()
+        return results
+
+    assert len(asyncio.run(main())) == 3
+    assert sum(path.endswith("members:batch") for _, path in calls) == 1
+
+
+def test_batch_endpoint_chunks_requests(make_client):
+    bodies = []
+
+    def handler(request):
+        bodies.append(json.loads(request.content))
+        return httpx.Response(200, json={"n": 1})
+
+    client = make_client(handler)
+    assert len(client.groups.remove_members("t", "g", [str(i) for i in range(1200)])) == 3
+    assert [len(body["user_ids"]) for body in bodies] == [500, 500, 200]
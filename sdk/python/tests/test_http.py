@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from coreauth import CoreAuthClient, CoreAuthError, RateLimitError
+from coreauth._http import HttpClient
+
+
+def test_304_revalidation_reuses_cached_body(make_client):
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304, headers={"etag": '"v1"'})
+        return httpx.Response(200, json={"data": [1]}, headers={"etag": '"v1"'})
+
+    client = make_client(handler)
+    assert client.admin.list_tenants() == {"data": [1]}
+    assert client.admin.list_tenants() == {"data": [1]}
+    assert seen == [None, '"v1"']
+
+
+def test_revalidated_body_is_not_shared_with_earlier_callers(make_client):
+    def handler(request):
+        if request.headers.get("if-none-match"):
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": [1]}, headers={"etag": '"v1"'})
+
+    client = make_client(handler)
+    client.admin.list_tenants()["data"].append(2)
+    assert client.admin.list_tenants() == {"data": [1]}
+
+
+def test_concurrent_gets_share_one_request(make_client):
+    calls = []
+    release = threading.Event()
+
+    def handler(request):
+        calls.append(request.url.path)
+        release.wait(5)
+        return httpx.Response(200, json={"ok": 1})
+
+    client = make_client(handler, cache_size=0)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(client.admin.get_stats())) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.2)
+    release.set()
+    for thread in threads:
+        thread.join()
+    assert results == [{"ok": 1}] * 10
+    assert len(calls) == 1
+    assert client._http._inflight == {}
+
+
+def test_async_concurrent_gets_share_one_request(make_async_client):
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={"ok": 1})
+
+    async def main():
+        client = make_async_client(handler, cache_size=0)
+        results = await asyncio.gather(*(client.audit.stats() for _ in range(10)))
+        await client.aclose()
+        return results
+
+    assert asyncio.run(main()) == [{"ok": 1}] * 10
+    assert len(calls) == 1
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_get_is_retried_honouring_retry_after(make_client, status):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if len(calls) < 3:
+            return httpx.Response(status, headers={"retry-after": "0"})
+        return httpx.Response(200, json={"ok": 1})
+
+    client = make_client(handler, cache_size=0)
+    assert client.audit.stats() == {"ok": 1}
+    assert calls == ["GET"] * 3
+
+
+def test_post_is_not_retried(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(429, headers={"retry-after": "0"}, json={"error": "rate_limited", "message": "slow"})
+
+    client = make_client(handler)
+    with pytest.raises(RateLimitError):
+        client._http.post("/api/anything", json={})
+    assert calls == ["POST"]
+
+
+def test_long_retry_after_is_surfaced_not_waited(make_client):
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503, headers={"retry-after": "120"})
+
+    client = make_client(handler, cache_size=0)
+    started = time.monotonic()
+    with pytest.raises(CoreAuthError):
+        client.audit.stats()
+    assert time.monotonic() - started < 1
+    assert len(calls) == 1
+
+
+def test_pool_is_shared_and_torn_down_with_the_last_client():
+    a = CoreAuthClient("http://pool.test")
+    b = CoreAuthClient("http://pool.test/")
+    other = CoreAuthClient("http://pool.test", limits=httpx.Limits(max_connections=5))
+    try:
+        assert a._http._transport is b._http._transport
+        assert other._http._transport is not a._http._transport
+        assert a._http._client.cookies is not b._http._client.cookies
+
+        a.close()
+        a.close()
+        assert a._http._pool_key in HttpClient._POOL
+        assert not b._http._client.is_closed
+
+        b.close()
+        assert b._http._pool_key not in HttpClient._POOL
+
+        c = CoreAuthClient("http://pool.test")
+        assert c._http._transport is not b._http._transport
+        c.close()
+    finally:
+        other.close()
+
+
+def test_pooled_client_keeps_environment_proxies(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.test:3128")
+    monkeypatch.setenv("NO_PROXY", "internal.test")
+    client = CoreAuthClient("https://proxied.test")
+    try:
+        mounts = {pattern.pattern: transport for pattern, transport in client._http._client._mounts.items()}
+        assert set(mounts) == {pattern.pattern for pattern in httpx.Client()._mounts}
+        assert mounts["https://"] is not None
+        assert mounts["all://*internal.test"] is None
+    finally:
+        client.close()
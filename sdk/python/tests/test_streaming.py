@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+
+import httpx
+import pytest
+
+from coreauth import CoreAuthError
+
+EVENTS = b'event: delivery\ndata: {"id": "a"}\n\n: keepalive\n\ndata: {"id":\ndata:  "b"}\n\n'
+
+
+def _stream(request):
+    return httpx.Response(200, content=EVENTS, headers={"content-type": "text/event-stream"})
+
+
+def test_server_sent_events_are_decoded(make_client):
+    client = make_client(_stream)
+    assert [d["id"] for d in client.webhooks.stream_deliveries("org", "hook")] == ["a", "b"]
+
+
+def test_async_server_sent_events_are_decoded(make_async_client):
+    async def main():
+        client = make_async_client(_stream)
+        ids = [d["id"] async for d in client.webhooks.stream_deliveries("org", "hook")]
+        await client.aclose()
+        return ids
+
+    assert asyncio.run(main()) == ["a", "b"]
+
+
+def test_malformed_event_data_raises_coreauth_error(make_client):
+    def handler(request):
+        return httpx.Response(200, content=b"data: {oops\n\n", headers={"content-type": "text/event-stream"})
+
+    client = make_client(handler)
+    with pytest.raises(CoreAuthError, match="oops"):
+        list(client.webhooks.stream_deliveries("org", "hook"))
+
+
+def test_polling_fallback_pages_back_to_the_last_seen_delivery(make_client):
+    rows: list[dict] = []  # newest first, as the server lists them
+
+    def add(count):
+        for _ in range(count):
+            i = len(rows)
+            rows.insert(0, {"id": f"d{i}", "created_at": f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}.5Z"})
+
+    polls = []
+
+    def handler(request):
+        if request.url.path.endswith(":stream"):
+            return httpx.Response(404)
+        polls.append(request.url.params.get("offset"))
+        if len(polls) == 2:
+            add(237)
+        limit = int(request.url.params["limit"])
+        offset = int(request.url.params.get("offset", 0))
+        return httpx.Response(200, json=rows[offset : offset + limit])
+
+    add(10)
+    client = make_client(handler, cache_size=0)
+    stream = client.webhooks.stream_deliveries("org", "hook", poll_interval=0, page_size=500)
+    got = [d["id"] for d in itertools.islice(stream, 237)]
+    assert got == [f"d{i}" for i in range(10, 247)]
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from coreauth.types import AuditLog, AuditLogsResponse, CreateScimUserRequest, ScimPatchRequest, parse_list
+
+ROWS = [
+    {"id": "a", "event_type": "user.login", "created_at": "2024-01-01T00:00:00Z", "unknown": 1},
+    {"id": "b", "event_type": "user.login", "created_at": "2024-01-02T00:00:00Z"},
+]
+
+
+def _page(rows=ROWS):
+    return AuditLogsResponse.model_validate({"logs": rows, "total": len(rows), "limit": 50, "offset": 0})
+
+
+def test_lazy_rows_validate_on_access_and_memoize():
+    logs = _page().logs
+    assert len(logs) == 2
+    assert logs._rows == [None, None]
+    first = logs[0]
+    assert isinstance(first, AuditLog) and first.created_at == datetime.fromisoformat("2024-01-01T00:00:00+00:00")
+    assert logs[0] is first
+    assert logs._rows[1] is None
+    assert [log.id for log in logs[::-1]] == ["b", "a"]
+
+
+def test_lazy_rows_share_interned_strings():
+    logs = _page().logs
+    assert logs[0].event_type is logs[1].event_type
+
+
+def test_lazy_rows_serialize_through_the_item_model():
+    dumped = _page().model_dump()
+    assert "unknown" not in dumped["logs"][0]
+    assert isinstance(dumped["logs"][0]["created_at"], datetime)
+    assert json.loads(_page().model_dump_json())["logs"][1]["id"] == "b"
+
+
+def test_lazy_rows_json_schema_describes_the_items():
+    for mode in ("validation", "serialization"):
+        schema = AuditLogsResponse.model_json_schema(mode=mode)
+        assert schema["properties"]["logs"]["items"] == {"$ref": "#/$defs/AuditLog"}
+
+
+def test_lazy_rows_default_and_rejects_non_lists():
+    assert len(AuditLogsResponse.model_validate({"total": 0, "limit": 50, "offset": 0}).logs) == 0
+    with pytest.raises(ValidationError):
+        AuditLogsResponse.model_validate({"logs": 5, "total": 0, "limit": 50, "offset": 0})
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        ROWS,
+        {"data": ROWS},
+        json.dumps(ROWS),
+        json.dumps(ROWS).encode(),
+        json.dumps({"data": ROWS}),
+        json.dumps({"data": ROWS}).encode(),
+        b"  " + json.dumps(ROWS).encode(),
+    ],
+    ids=["list", "envelope", "str", "bytes", "str-envelope", "bytes-envelope", "bytes-leading-space"],
+)
+def test_parse_list_inputs(data):
+    logs = parse_list(AuditLog, data)
+    assert [log.id for log in logs] == ["a", "b"]
+    assert all(isinstance(log, AuditLog) for log in logs)
+
+
+def test_parse_list_empty_envelope():
+    assert parse_list(AuditLog, {}) == []
+    assert parse_list(AuditLog, b"{}") == []
+
+
+def test_scim_request_bodies_use_scim_keys():
+    body = json.loads(CreateScimUserRequest(user_name="ada", name={"givenName": "Ada"}, display_name="Ada").to_json())
+    assert body["userName"] == "ada" and body["displayName"] == "Ada"
+    assert body["schemas"] == ["urn:ietf:params:scim:schemas:core:2.0:User"]
+    assert "operations" not in json.loads(ScimPatchRequest(operations=[{"op": "remove", "path": "x"}]).to_json())